@@ -0,0 +1,112 @@
+"""
+Benchmark parsing of wide worksheets (500+ columns).
+
+Compares the default (precompiled) row conversion with the previous
+per-cell parse_row() implementation.
+
+Usage: python benchmarks/wide_sheet.py [columns] [rows]
+"""
+
+from itertable import ExcelFileIter
+from openpyxl import Workbook, load_workbook
+import datetime
+import tempfile
+import shutil
+import sys
+import os
+import time
+
+
+class PerCellMixin:
+    def parse_row(self, row):
+        return {
+            name: self.get_value(row[i])
+            for i, name in enumerate(self.get_field_names())
+            if i < len(row)
+        }
+
+
+class CachedRowsMixin:
+    "Skip openpyxl's XML parsing, to measure row conversion on its own"
+
+    rows = None
+    sheet_names = ["Sheet"]
+
+    def parse_workbook(self):
+        self.workbook = self.rows
+
+    def close_workbook(self):
+        pass
+
+    def parse_worksheet(self, name):
+        self.worksheet = self.rows
+
+
+class PerCellExcelFileIter(PerCellMixin, ExcelFileIter):
+    pass
+
+
+class CachedExcelFileIter(CachedRowsMixin, ExcelFileIter):
+    pass
+
+
+class CachedPerCellExcelFileIter(PerCellMixin, CachedExcelFileIter):
+    pass
+
+
+def make_workbook(filename, columns, rows):
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.append(["field%s" % c for c in range(columns)])
+    date = datetime.datetime(2024, 1, 1)
+    for r in range(rows):
+        row = [r * c for c in range(columns)]
+        if r % 10 == 0:
+            row[0] = date
+        worksheet.append(row)
+    workbook.save(filename)
+
+
+def timed(cls, filename, **options):
+    start = time.perf_counter()
+    instance = cls(filename=filename, **options)
+    elapsed = time.perf_counter() - start
+    return elapsed, instance
+
+
+def main(columns=500, rows=2000):
+    tempdir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(tempdir, "wide.xlsx")
+        make_workbook(filename, columns, rows)
+        print("%s columns x %s rows" % (columns, rows))
+
+        for read_only in False, True:
+            old, expected = timed(
+                PerCellExcelFileIter, filename, read_only=read_only
+            )
+            new, instance = timed(ExcelFileIter, filename, read_only=read_only)
+            assert instance.data == expected.data
+            print(
+                "Full parse (read_only=%s): per-cell %.2fs, precompiled %.2fs"
+                % (read_only, old, new)
+            )
+
+        workbook = load_workbook(filename, read_only=True)
+        values = list(workbook.active.iter_rows(values_only=True))
+        workbook.close()
+        old, expected = timed(
+            CachedPerCellExcelFileIter, filename, rows=values
+        )
+        new, instance = timed(CachedExcelFileIter, filename, rows=values)
+        assert instance.data == expected.data
+        print(
+            "Header detection and row conversion only: "
+            "per-cell %.2fs, precompiled %.2fs" % (old, new)
+        )
+    finally:
+        shutil.rmtree(tempdir)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -7,6 +7,7 @@ from .loaders import (
     ZipFileLoader,
     StringLoader,
     NetLoader,
+    AsyncNetLoader,
     ZipNetLoader,
 )
 
@@ -31,6 +32,7 @@ from .util import (
     load_file,
     load_url,
     load_string,
+    load_many,
     guess_type,
     flattened,
 )
@@ -49,6 +51,7 @@ __all__ = (
     "ZipFileLoader",
     "StringLoader",
     "NetLoader",
+    "AsyncNetLoader",
     "ZipNetLoader",
     "CsvParser",
     "JsonParser",
@@ -64,6 +67,7 @@ __all__ = (
     "load_file",
     "load_url",
     "load_string",
+    "load_many",
     "guess_type",
     "flattened",
     "VERSION",
@@ -1,4 +1,12 @@
 from collections.abc import MutableMapping, MutableSequence
+from itertools import chain, islice
+from .cache import DiskCache
+from .exceptions import ReadOnly
+from .mappers import BaseMapper, TupleMapper
+import asyncio
+import hashlib
+import pickle
+import os
 
 
 class BaseIter(MutableMapping, MutableSequence):
@@ -9,10 +17,18 @@ class BaseIter(MutableMapping, MutableSequence):
     binary = False
     loaded = False
     parsed = False
+    stream = False
+    lazy = False
+
+    # Optional on-disk cache of parse results (path to a directory), keyed by
+    # the source file (or content) and the options used to parse it.
+    parse_cache = None
+    parse_cache_max_size = None
 
     def __init__(self, **kwargs):
         self.__dict__.update(kwargs)
-        self.refresh()
+        if not self.lazy:
+            self.refresh()
 
     def refresh(self):
         if not self.loaded:
@@ -24,15 +40,125 @@ class BaseIter(MutableMapping, MutableSequence):
 
         if getattr(self, "empty_file", False):
             self.data = []
+        elif self.stream:
+            # Defer parsing until the rows are iterated (see iter_data())
+            return
         else:
-            self.parse()
-            if hasattr(self, "file"):
-                f = self.file
-                if hasattr(f, "close") and not getattr(f, "closed", False):
-                    f.close()
+            if self.parse_cache:
+                self.parse_cached()
+            else:
+                self.parse()
+            self.close_file()
 
         self.parsed = True
 
+    @classmethod
+    async def aload(cls, **kwargs):
+        """
+        Asynchronous alternative to the constructor, for use with asyncio.
+        Loading is done via load_async(), and parsing in a worker thread.
+        """
+        instance = cls.__new__(cls)
+        instance.__dict__.update(kwargs)
+        await instance.arefresh()
+        return instance
+
+    async def arefresh(self):
+        if not self.loaded:
+            await self.load_async()
+            self.loaded = True
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.refresh)
+
+    async def load_async(self):
+        """
+        Open a resource without blocking the event loop (defined by async
+        loader mixins).  The default runs load() in a worker thread.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.load)
+
+    def get_parse_cache(self):
+        if not self.parse_cache:
+            return None
+        return DiskCache(self.parse_cache, max_size=self.parse_cache_max_size)
+
+    def get_parse_cache_key(self, cache):
+        filename = getattr(self, "filename", None)
+        file = getattr(self, "file", None)
+        if filename and getattr(file, "name", None) == filename:
+            stat = os.stat(filename)
+            source = (
+                os.path.abspath(filename),
+                stat.st_size,
+                stat.st_mtime_ns,
+            )
+        elif hasattr(file, "getvalue"):
+            content = file.getvalue()
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+            source = hashlib.sha256(content).hexdigest()
+        else:
+            return None
+
+        simple_types = (str, bytes, int, float, bool, type(None))
+        options = sorted(
+            (name, value)
+            for name, value in self.__dict__.items()
+            if name not in ("loaded", "empty_file")
+            and (
+                isinstance(value, simple_types)
+                or isinstance(value, (list, tuple))
+                and all(isinstance(v, simple_types) for v in value)
+            )
+        )
+        classes = [
+            "%s.%s" % (cls.__module__, cls.__name__)
+            for cls in type(self).__mro__
+        ]
+        return cache.get_key(source, options, classes)
+
+    def parse_cached(self):
+        "Parse the resource, or restore the result of a previous parse"
+        cache = self.get_parse_cache()
+        key = self.get_parse_cache_key(cache)
+        if key is None:
+            self.parse()
+            return
+
+        if cache.get_meta(key) is not None:
+            try:
+                with open(cache.get_path(key), "rb") as f:
+                    state = pickle.load(f)
+            except Exception:
+                cache.delete(key)
+            else:
+                self.__dict__.update(state)
+                cache.touch(key)
+                return
+
+        # Save the attributes set by parse() (except those in no_pickle)
+        before = self.__dict__.copy()
+        self.parse()
+        state = {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in before or before[name] is not value
+        }
+        for name in self.get_no_pickle():
+            state.pop(name, None)
+        try:
+            content = pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        cache.set(key, [content], {})
+
+    def close_file(self):
+        if hasattr(self, "file"):
+            f = self.file
+            if hasattr(f, "close") and not getattr(f, "closed", False):
+                f.close()
+
     def load(self):
         "Open a resource (defined by loader mixins)"
         # self.file = ...
@@ -46,22 +172,138 @@ class BaseIter(MutableMapping, MutableSequence):
         # self.data = some_parse_method(self.file)
         pass
 
-    def dump(self, file=None):
+    def parse_stream(self):
+        """
+        Parse a resource incrementally, yielding one row at a time (defined by
+        parser mixins that support streaming).  The default implementation
+        parses the entire resource up front.
+        """
+        self.parse()
+        self.parsed = True
+        yield from self.data
+
+    def iter_data(self):
+        """
+        Iterate over the raw rows.  In stream mode, rows are parsed on demand
+        and the file is closed (and reloaded if needed) after each pass.
+        """
+        if not self.parsed and not self.stream:
+            # Lazily loaded resource
+            self.refresh()
+
+        if self.parsed:
+            yield from self.data
+            return
+
+        if not self.loaded:
+            self.load()
+            self.loaded = True
+        try:
+            yield from self.parse_stream()
+        finally:
+            self.close_file()
+            self.loaded = False
+
+    def require_data(self):
+        "Fully parse a streaming or lazy resource (for random access)"
+        if self.parsed:
+            return
+        if self.stream:
+            self.data = list(self.iter_data())
+            self.parsed = True
+        else:
+            self.refresh()
+
+    def preload_nested(self, max_workers=None):
+        "Parse lazily loaded nested Iters concurrently"
+        from concurrent.futures import ThreadPoolExecutor
+
+        def require_data(row):
+            row["data"].require_data()
+
+        with ThreadPoolExecutor(max_workers) as executor:
+            list(executor.map(require_data, self.data))
+
+    def dump(self, file=None, data=None):
         """"""
         if file is None:
             file = self.file
-        file.write(str(self.data))
+        if data is not None:
+            data = list(self.get_dump_data(data))
+        else:
+            data = self.get_dump_data()
+        file.write(str(data))
+
+    def get_dump_data(self, data=None):
+        """
+        Returns the rows to write in dump().  data can be any iterable
+        (including another Iter) and defaults to self.data.
+        """
+        if data is None:
+            self.check_writable()
+            return self.data
+        if hasattr(data, "iter_data"):
+            return data.iter_data()
+        return data
+
+    def get_dump_rows(self, data=None):
+        """
+        Returns the field names and rows to write in dump().  Rows are not
+        materialized, so streaming sources are written incrementally.
+        """
+        if data is None:
+            self.check_writable()
+            return self.get_field_names(), self.data
+
+        field_names = None
+        if self.field_names is not None:
+            field_names = self.get_field_names()
+        elif hasattr(data, "get_field_names"):
+            field_names = data.get_field_names()
+        data = self.get_dump_data(data)
+        if field_names is None:
+            # Use the keys of the first row
+            data = iter(data)
+            first = next(data, None)
+            if first is None:
+                return [], []
+            field_names = list(first.keys())
+            data = chain([first], data)
+        return field_names, data
 
     def save(self):
         """"""
+        self.check_writable()
         self.dump(self.file)
 
+    def check_writable(self):
+        "Iters loaded with columns only have part of the data"
+        if self.columns is not None:
+            raise ReadOnly(
+                "Iters loaded with columns cannot be modified or saved"
+            )
+
     field_names = None
     scan_fields = False
     _auto_field_names = None
 
+    # Raw fields to load (default is all fields).  Parsers skip any other
+    # fields while reading, and items only include these fields.
+    columns = None
+
     def get_field_names(self):
         "Returns a list of raw fields to expect (defined by parser mixins)"
+        return self.project_fields(self.get_all_field_names())
+
+    def project_fields(self, field_names):
+        "Filter a list of raw field names to the requested columns"
+        if field_names is None or self.columns is None:
+            return field_names
+        columns = set(self.columns)
+        return [name for name in field_names if name in columns]
+
+    def get_all_field_names(self):
+        "Returns all raw fields in the source, ignoring columns"
         if self.field_names is not None:
             # Support specifying field_names as string (like namedtuple does)
             if isinstance(self.field_names, str):
@@ -69,13 +311,15 @@ class BaseIter(MutableMapping, MutableSequence):
             else:
                 return self.field_names
 
+        # Field names previously retrieved from data (or the first streamed
+        # item)
+        if self._auto_field_names:
+            return self._auto_field_names
+
         # If no defined field names, try to retrieve from data
         if not getattr(self, "data", None):
             return None
 
-        if self._auto_field_names:
-            return self._auto_field_names
-
         if self.scan_fields:
             # Scan all rows for field names
             field_names = set()
@@ -113,19 +357,64 @@ class BaseIter(MutableMapping, MutableSequence):
         if getattr(self, "_index_cache", None) is not None and not recompute:
             return self._index_cache
 
+        self.require_data()
+
         index = {}
         for i, item in enumerate(self.data):
-            uitem = self.usable_item(item)
-            if isinstance(uitem, dict):
-                key = uitem.get(key_field, None)
-            else:
-                key = getattr(uitem, key_field, None)
+            key = self.get_item_key(item, key_field)
             if key is not None:
                 index[key] = i
 
         self._index_cache = index
         return index
 
+    def get_item_key(self, item, key_field=None):
+        if key_field is None:
+            key_field = self.get_key_field()
+        uitem = self.usable_item(item)
+        if isinstance(uitem, dict):
+            return uitem.get(key_field, None)
+        else:
+            return getattr(uitem, key_field, None)
+
+    def index_item(self, position, item):
+        """
+        Update the key index after an item is inserted at position, without
+        recomputing keys for every other item.
+        """
+        index = getattr(self, "_index_cache", None)
+        if index is None:
+            return
+        if position < len(self.data) - 1:
+            for key, i in index.items():
+                if i >= position:
+                    index[key] = i + 1
+        key = self.get_item_key(item)
+        # As in compute_index(), the last item with a given key wins
+        if key is not None and index.get(key, -1) < position:
+            index[key] = position
+
+    def unindex_item(self, position):
+        "Update the key index after the item at position is removed"
+        index = getattr(self, "_index_cache", None)
+        if index is None:
+            return
+        removed = None
+        for key, i in index.items():
+            if i > position:
+                index[key] = i - 1
+            elif i == position:
+                removed = key
+        if removed is None:
+            return
+        # An earlier item may have the same key (see compute_index())
+        key_field = self.get_key_field()
+        for i in range(position - 1, -1, -1):
+            if self.get_item_key(self.data[i], key_field) == removed:
+                index[removed] = i
+                return
+        del index[removed]
+
     def find_index(self, key):
         index = self.compute_index()
         if index is not None:
@@ -134,37 +423,49 @@ class BaseIter(MutableMapping, MutableSequence):
             return key
 
     def __len__(self):
+        self.require_data()
         return len(self.data)
 
     def __getitem__(self, key):
+        self.require_data()
         index = self.find_index(key)
         if index is None:
             raise KeyError
         return self.usable_item(self.data[index])
 
     def __setitem__(self, key, uitem):
+        self.check_writable()
+        self.require_data()
         item = self.parse_usable_item(uitem)
         index = self.find_index(key)
         if index is not None:
             self.data[index] = item
         else:
             self.data.append(item)
-            self.compute_index(True)
+            self.index_item(len(self.data) - 1, item)
 
     def __delitem__(self, key):
+        self.check_writable()
+        self.require_data()
         index = self.find_index(key)
         if index is None:
             raise KeyError
         del self.data[index]
-        self.compute_index(True)
+        self.unindex_item(index)
 
     def insert(self, index, uitem):
+        self.check_writable()
+        self.require_data()
         item = self.parse_usable_item(uitem)
+        # Normalize position (following list.insert() semantics)
+        if index < 0:
+            index = max(len(self.data) + index, 0)
+        index = min(index, len(self.data))
         self.data.insert(index, item)
-        self.compute_index(True)
+        self.index_item(index, item)
 
     def __iter__(self):
-        for item in self.data:
+        for item in self.iter_data():
             uitem = self.usable_item(item)
             if uitem is None:
                 return
@@ -176,6 +477,28 @@ class BaseIter(MutableMapping, MutableSequence):
             else:
                 yield getattr(uitem, pk, None)
 
+    # Number of items to parse per worker thread call in async iteration
+    async_batch_size = 1000
+
+    async def __aiter__(self):
+        """
+        Iterate asynchronously (as with __iter__()), parsing batches of items
+        in a worker thread.  Most useful in stream mode.
+        """
+        if not self.parsed and not self.loaded:
+            await self.load_async()
+            self.loaded = True
+        loop = asyncio.get_running_loop()
+        items = iter(self)
+        while True:
+            batch = await loop.run_in_executor(
+                None, list, islice(items, self.async_batch_size)
+            )
+            for item in batch:
+                yield item
+            if len(batch) < self.async_batch_size:
+                return
+
     def sync(self, other, save=True):
         if self.get_key_field() is None or other.get_key_field() is None:
             raise Exception("Key field required to sync!")
@@ -185,8 +508,10 @@ class BaseIter(MutableMapping, MutableSequence):
             other.save()
 
     def copy(self, other, save=True):
+        other.require_data()
         del other.data[:]
-        for item in self.data:
+        other.compute_index(True)
+        for item in self.iter_data():
             uitem = self.usable_item(item)
             other.append(uitem)
         if save:
@@ -215,20 +540,68 @@ class BaseIter(MutableMapping, MutableSequence):
         state = self.__dict__.copy()
         for name in self.get_no_pickle():
             state.pop(name, None)
+        if not self.parsed:
+            # Unparsed (e.g. streaming) resources will need to be reloaded
+            state.pop("loaded", None)
         return state
 
     def item_dict(self, item):
         return item
 
+    # Build DataFrames column-wise via parse_columns() and usable_columns().
+    # By default this is only done if usable_item() and item_dict() have not
+    # been customized (see use_columnar).
+    columnar = None
+
+    @property
+    def use_columnar(self):
+        if self.columnar is not None:
+            return self.columnar
+        cls = type(self)
+        return (
+            cls.usable_item in STOCK_USABLE_ITEM
+            and cls.item_dict in STOCK_ITEM_DICT
+        )
+
+    def parse_columns(self):
+        """
+        Returns the raw data as a dict of column lists, keyed by field name.
+        Parser mixins may override this to avoid creating row dicts.
+        """
+        self.require_data()
+        field_names = self.get_field_names() or []
+        return {
+            field: [row.get(field, None) for row in self.data]
+            for field in field_names
+        }
+
+    def usable_columns(self, columns):
+        "Hook to allow columns to be transformed (see usable_item())"
+        return columns
+
     def as_dataframe(self):
         from pandas import DataFrame
 
-        key = self.get_key_field()
-        if key:
-            data = [self.item_dict(row) for row in self.values()]
+        if self.use_columnar:
+            data = self.usable_columns(self.parse_columns())
+            key = self.get_key_field()
         else:
-            data = [self.item_dict(row) for row in self]
+            key = self.get_key_field()
+            if key:
+                data = [self.item_dict(row) for row in self.values()]
+            else:
+                data = [self.item_dict(row) for row in self]
         df = DataFrame(data)
         if key:
             df.set_index(key, inplace=True)
         return df
+
+
+# Implementations of usable_item() and item_dict() that are compatible with
+# usable_columns() (see BaseIter.use_columnar)
+STOCK_USABLE_ITEM = (
+    BaseIter.usable_item,
+    BaseMapper.usable_item,
+    TupleMapper.usable_item,
+)
+STOCK_ITEM_DICT = (BaseIter.item_dict, TupleMapper.item_dict)
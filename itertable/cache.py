@@ -0,0 +1,117 @@
+from contextlib import contextmanager
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+
+class DiskCache(object):
+    """
+    Minimal on-disk cache.  Each entry consists of a data file and a JSON
+    metadata file.  Entries can expire after ttl seconds, and the least
+    recently used entries are evicted once the total size of the data files
+    exceeds max_size bytes.
+    """
+
+    def __init__(self, directory, ttl=None, max_size=None):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_size = max_size
+        os.makedirs(directory, exist_ok=True)
+
+    def get_key(self, *parts):
+        return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+    def get_path(self, key, ext="data"):
+        return os.path.join(self.directory, "%s.%s" % (key, ext))
+
+    def get_meta(self, key):
+        try:
+            with open(self.get_path(key, "json")) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not os.path.exists(self.get_path(key)):
+            return None
+        return meta
+
+    def is_fresh(self, meta):
+        if self.ttl is None:
+            return False
+        return time.time() - meta.get("time", 0) < self.ttl
+
+    def touch(self, key, meta=None):
+        "Mark an entry as recently used (and optionally update its metadata)"
+        if meta is not None:
+            meta["time"] = time.time()
+            self.write_meta(key, meta)
+        try:
+            os.utime(self.get_path(key))
+        except OSError:
+            pass
+
+    def write_meta(self, key, meta):
+        with self.open_temp(self.get_path(key, "json"), "w") as f:
+            json.dump(meta, f)
+
+    @contextmanager
+    def open_temp(self, path, mode):
+        """
+        Write to a uniquely named temporary file, which replaces path once
+        complete (so concurrent writers never share or publish partial files)
+        """
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with open(fd, mode) as f:
+                yield f
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def set(self, key, chunks, meta):
+        """
+        Store an entry from an iterable of bytes chunks, so large values do
+        not need to be held in memory.
+        """
+        with self.open_temp(self.get_path(key), "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        meta["time"] = time.time()
+        self.write_meta(key, meta)
+        self.evict(keep=key)
+
+    def delete(self, key):
+        for ext in "data", "json":
+            try:
+                os.remove(self.get_path(key, ext))
+            except OSError:
+                pass
+
+    def evict(self, keep=None):
+        if self.max_size is None:
+            return
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(".data"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name[:-5]))
+            total += stat.st_size
+
+        entries.sort()
+        for mtime, size, key in entries:
+            if total <= self.max_size:
+                break
+            if key == keep:
+                continue
+            self.delete(key)
+            total -= size
@@ -48,6 +48,12 @@ class MappingFailed(IterException):
     pass
 
 
+class ReadOnly(IterException):
+    """Data was only partially loaded and cannot be modified or saved!"""
+
+    pass
+
+
 class NoData(IterException):
     """No data returned!"""
 
@@ -14,12 +14,12 @@ class MetaSyncIter(BaseIter):
             other.meta["driver"] = driver
         super(MetaSyncIter, self).sync(other, save)
 
-    def get_field_names(self):
+    def get_all_field_names(self):
         if self.field_names is None and self.meta is not None:
             return ["id", "geometry"] + list(
                 self.meta["schema"]["properties"].keys()
             )
-        return super(MetaSyncIter, self).get_field_names()
+        return super(MetaSyncIter, self).get_all_field_names()
 
 
 class GisIter(FionaLoaderParser, GisMapper, MetaSyncIter):
@@ -62,10 +62,22 @@ class FionaLoaderParser(FileLoader, BaseParser):
     def parse_feature(self, f):
         # Flatten Fiona's GeoJSON-style representation into something more
         # amenable to namedtuple-ing
-        feat = {key: value for key, value in f["properties"].items()}
+        columns = self.columns
+        if columns is None:
+            feat = {key: value for key, value in f["properties"].items()}
+        else:
+            columns = set(columns)
+            feat = {
+                key: value
+                for key, value in f["properties"].items()
+                if key in columns
+            }
         if "id" not in feat and "ID" not in feat:
-            feat["id"] = f["id"]
-        feat["geometry"] = f["geometry"]
+            if columns is None or "id" in columns:
+                feat["id"] = f["id"]
+        # Only include (and later convert) the geometry if requested
+        if columns is None or "geometry" in columns:
+            feat["geometry"] = f["geometry"]
         return feat
 
     def dump_feature(self, feat, i):
@@ -89,6 +101,7 @@ class FionaLoaderParser(FileLoader, BaseParser):
         pass
 
     def save(self):
+        self.check_writable()
         with fiona.open(self.filename, "w", **self.meta) as f:
             for i, feat in enumerate(self.data):
                 f.write(self.dump_feature(feat, i))
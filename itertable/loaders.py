@@ -1,8 +1,16 @@
 from __future__ import print_function
 import requests
-from io import StringIO, BytesIO
+from requests.adapters import HTTPAdapter
+from io import StringIO, BytesIO, TextIOWrapper, BufferedIOBase
 from .exceptions import LoadFailed
+from .cache import DiskCache
 from zipfile import ZipFile
+from threading import Lock
+from http.cookiejar import DefaultCookiePolicy
+import asyncio
+import mimetypes
+import mmap
+import weakref
 
 try:
     from .version import VERSION
@@ -10,6 +18,114 @@ except ImportError:
     VERSION = "0.0.0"
 
 
+# Shared requests sessions, keyed by connection pool settings
+_sessions = {}
+_sessions_lock = Lock()
+
+
+def get_session(pool_connections=10, pool_maxsize=10, pool_block=False):
+    """
+    Returns a shared requests.Session, so that connections to the same host
+    are kept alive and reused across NetLoader instances.  The session does
+    not store cookies, so they are not leaked between instances.
+    """
+    key = (pool_connections, pool_maxsize, pool_block)
+    with _sessions_lock:
+        if key not in _sessions:
+            session = requests.Session()
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[key] = session
+        return _sessions[key]
+
+
+# Shared httpx.AsyncClients (and their cleanup tasks), one per event loop
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_async_client():
+    """
+    Returns an httpx.AsyncClient shared by AsyncNetLoader instances running in
+    the current event loop, so that connections are pooled.  The client is
+    closed when the loop shuts down (e.g. at the end of asyncio.run()).
+    """
+    import httpx
+
+    loop = asyncio.get_running_loop()
+    client, task = _async_clients.get(loop, (None, None))
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient()
+        task = loop.create_task(_close_async_client(loop, client))
+        _async_clients[loop] = client, task
+    return client
+
+
+async def _close_async_client(loop, client):
+    "Wait until the pending tasks of the loop are cancelled, then close client"
+    try:
+        await loop.create_future()
+    finally:
+        if _async_clients.get(loop, (None,))[0] is client:
+            del _async_clients[loop]
+        await client.aclose()
+
+
+class MemoryMapIO(BufferedIOBase):
+    """
+    Read-only binary file interface to a memory-mapped file.  getbuffer()
+    returns a zero-copy view of the contents (like BytesIO.getbuffer()).
+    """
+
+    def __init__(self, filename):
+        with open(filename, "rb") as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.name = filename
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = None
+        return self.mmap.read(size)
+
+    read1 = read
+
+    def readinto(self, b):
+        data = self.mmap.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+    def readline(self, size=-1):
+        if size is None or size < 0:
+            return self.mmap.readline()
+        return super(MemoryMapIO, self).readline(size)
+
+    def seek(self, pos, whence=0):
+        self.mmap.seek(pos, whence)
+        return self.mmap.tell()
+
+    def tell(self):
+        return self.mmap.tell()
+
+    def getbuffer(self):
+        return memoryview(self.mmap)
+
+    def close(self):
+        if not self.closed:
+            self.mmap.close()
+        super(MemoryMapIO, self).close()
+
+
 class BaseLoader(object):
     no_pickle_loader = ["file"]
     empty_file = None
@@ -22,6 +138,10 @@ class FileLoader(BaseLoader):
     filename = None
     require_existing = True
 
+    # Read the file through a read-only memory map, which avoids copying data
+    # into read buffers and lets processes share the OS page cache.
+    memory_map = False
+
     @property
     def read_mode(self):
         return "rb" if self.binary else "r"
@@ -32,7 +152,7 @@ class FileLoader(BaseLoader):
 
     def load(self):
         try:
-            self.file = open(self.filename, self.read_mode)
+            self.file = self.open_file()
             self.empty_file = False
         except OSError as e:
             if self.require_existing:
@@ -47,7 +167,20 @@ class FileLoader(BaseLoader):
                 self.file = StringIO()
             self.empty_file = True
 
+    def open_file(self):
+        if self.memory_map:
+            try:
+                file = MemoryMapIO(self.filename)
+            except ValueError:
+                # Empty files cannot be mapped
+                pass
+            else:
+                return file if self.binary else TextIOWrapper(file)
+        return open(self.filename, self.read_mode)
+
     def save(self):
+        # (Check before truncating the file)
+        self.check_writable()
         file = open(self.filename, self.write_mode)
         self.dump(file)
         file.close()
@@ -56,16 +189,107 @@ class FileLoader(BaseLoader):
 class Zipper(object):
     inner_filename = None
     inner_binary = False
+    no_pickle_loader = ["file", "archive"]
+
+    # In nested mode (nested = True and no inner_filename), each member of
+    # the archive is a row with a lazily loaded Iter as its data.  Members in
+    # a format handled by a different parser are skipped.  If max_workers is
+    # set, the members are parsed concurrently.
+    max_workers = None
+
+    # Options that apply to the archive itself rather than its members
+    archive_options = [
+        "inner_filename",
+        "nested",
+        "lazy",
+        "max_workers",
+        "loaded",
+        "parsed",
+        "file",
+        "data",
+        "filename",
+        "string",
+    ]
+
+    def __init__(self, **kwargs):
+        # Save options to pass on to member Iters (see get_inner_options())
+        self._init_options = kwargs
+        super(Zipper, self).__init__(**kwargs)
+
+    @property
+    def nested_archive(self):
+        return self.nested and not self.inner_filename
 
     def unzip_file(self):
-        zipfile = ZipFile(self.file)
-        inner_file = zipfile.read(self.get_inner_filename(zipfile))
+        self.archive = ZipFile(self.file)
+        if self.nested_archive:
+            return
+        inner_file = self.archive.open(self.get_inner_filename(self.archive))
         if self.inner_binary:
-            self.file = BytesIO(inner_file)
+            # Binary formats (e.g. workbooks) generally require random access
+            self.file = BytesIO(inner_file.read())
+            inner_file.close()
+            self.close_archive()
         else:
-            self.file = StringIO(inner_file.decode("utf-8"))
-        zipfile.fp.close()
-        zipfile.close()
+            # Decompress text as it is read (archive is closed by close_file)
+            self.file = TextIOWrapper(inner_file, encoding="utf-8", newline="")
+
+    def close_file(self):
+        super(Zipper, self).close_file()
+        self.close_archive()
+
+    def close_archive(self):
+        archive = getattr(self, "archive", None)
+        if archive is None:
+            return
+        if archive.fp is not None:
+            archive.fp.close()
+        archive.close()
+        self.archive = None
+
+    def parse(self):
+        if not self.nested_archive:
+            return super(Zipper, self).parse()
+
+        ZipIter = type(self)
+        self.data = [
+            {
+                "name": name,
+                "data": ZipIter(**self.get_inner_options(name)),
+            }
+            for name in self.archive.namelist()
+            if not name.endswith("/") and self.can_parse_inner(name)
+        ]
+        if self.max_workers:
+            self.preload_nested(self.max_workers)
+
+    def parse_stream(self):
+        if not self.nested_archive:
+            return super(Zipper, self).parse_stream()
+        self.parse()
+        self.parsed = True
+        return iter(self.data)
+
+    def can_parse_inner(self, name):
+        "Whether an archive member appears to be in this Iter's format"
+        from .util import PARSERS
+
+        mimetype, encoding = mimetypes.guess_type(name)
+        parser = PARSERS.get(mimetype)
+        return parser is None or isinstance(self, parser)
+
+    def get_inner_options(self, name):
+        options = {
+            key: value
+            for key, value in getattr(self, "_init_options", {}).items()
+            if key not in self.archive_options
+        }
+        options.update(
+            inner_filename=name,
+            nested=False,
+            lazy=True,
+        )
+        return options
 
     def get_inner_filename(self, zipfile):
         if self.inner_filename:
@@ -74,8 +298,7 @@ class Zipper(object):
         if len(names) == 1:
             return names[0]
 
-        zipfile.fp.close()
-        zipfile.close()
+        self.close_archive()
         raise LoadFailed("Multiple Inner Files!")
 
 
@@ -86,6 +309,11 @@ class ZipFileLoader(Zipper, FileLoader):
         super(ZipFileLoader, self).load()
         self.unzip_file()
 
+    def get_inner_options(self, name):
+        options = super(ZipFileLoader, self).get_inner_options(name)
+        options["filename"] = self.filename
+        return options
+
 
 class StringLoader(BaseLoader):
     string = ""
@@ -100,6 +328,7 @@ class StringLoader(BaseLoader):
         self.file = self._io_class(self.string)
 
     def save(self):
+        self.check_writable()
         file = self._io_class()
         self.dump(file)
         self.string = file.getvalue()
@@ -113,7 +342,20 @@ class NetLoader(StringLoader):
     password = None
     debug = False
     url = None
-    client = requests
+
+    # HTTP client (defaults to a shared session with the pool settings below)
+    client = None
+    pool_connections = 10
+    pool_maxsize = 10
+    pool_block = False
+
+    # Optional on-disk cache for GET requests (path to a directory).  Cached
+    # responses are revalidated via ETag / Last-Modified unless they are less
+    # than http_cache_ttl seconds old.
+    http_cache = None
+    http_cache_ttl = None
+    http_cache_max_size = None
+    http_cache_chunk_size = 2 ** 16
 
     @property
     def user_agent(self):
@@ -128,11 +370,98 @@ class NetLoader(StringLoader):
             "User-Agent": self.user_agent,
         }
 
+    def get_client(self):
+        if self.client is not None:
+            return self.client
+        return get_session(
+            self.pool_connections, self.pool_maxsize, self.pool_block
+        )
+
     def load(self, **kwargs):
-        result = self.GET()
-        self.file = self._io_class(result)
+        if self.stream:
+            # Let the parser read the response as it is downloaded
+            self.file = self.GET(stream=True)
+        else:
+            result = self.GET()
+            self.file = self._io_class(result)
+
+    def req(
+        self,
+        url=None,
+        method=None,
+        params=None,
+        body=None,
+        headers={},
+        stream=False,
+    ):
+        url, params, all_headers, auth = self.prepare_request(
+            url, method, params, headers
+        )
 
-    def req(self, url=None, method=None, params=None, body=None, headers={}):
+        cache = self.get_http_cache() if method == "GET" else None
+        if cache:
+            key = cache.get_key(url, params, self.username)
+            meta = cache.get_meta(key)
+            if meta and cache.is_fresh(meta):
+                cache.touch(key)
+                return self.read_cached(cache, key, meta, stream)
+            if meta and meta.get("etag"):
+                all_headers["If-None-Match"] = meta["etag"]
+            if meta and meta.get("last_modified"):
+                all_headers["If-Modified-Since"] = meta["last_modified"]
+
+        client = self.get_client()
+        resp = client.request(
+            method,
+            url,
+            params=params,
+            headers=all_headers,
+            auth=auth,
+            data=body,
+            stream=stream,
+        )
+        if client is requests and not stream:
+            # Not pooled, so there is no reason to keep the connection open
+            resp.connection.close()
+
+        if cache and meta and resp.status_code == 304:
+            resp.close()
+            cache.touch(key, meta)
+            return self.read_cached(cache, key, meta, stream)
+
+        if resp.status_code < 200 or resp.status_code > 299:
+            raise LoadFailed(
+                resp.text,
+                path=url,
+                code=resp.status_code,
+            )
+
+        if cache:
+            if self.binary:
+                encoding = None
+            else:
+                encoding = resp.encoding or resp.apparent_encoding
+            meta = {
+                "url": url,
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+                "encoding": encoding,
+            }
+            if stream:
+                chunks = resp.iter_content(self.http_cache_chunk_size)
+            else:
+                chunks = [resp.content]
+            cache.set(key, chunks, meta)
+            return self.read_cached(cache, key, meta, stream)
+
+        if stream:
+            return self.open_stream(resp)
+        elif self.binary:
+            return resp.content
+        else:
+            return resp.text
+
+    def prepare_request(self, url, method, params, headers):
         if url is None:
             url = self.url
             if url is None:
@@ -162,16 +491,96 @@ class NetLoader(StringLoader):
 
         all_headers = self.headers.copy()
         all_headers.update(headers)
+        return url, params, all_headers, auth
+
+    def get_http_cache(self):
+        if not self.http_cache:
+            return None
+        return DiskCache(
+            self.http_cache,
+            ttl=self.http_cache_ttl,
+            max_size=self.http_cache_max_size,
+        )
 
-        resp = self.client.request(
-            method,
-            url,
+    def read_cached(self, cache, key, meta, stream=False):
+        path = cache.get_path(key)
+        encoding = meta.get("encoding") or "utf-8"
+        if stream:
+            if self.binary:
+                return open(path, "rb")
+            return open(path, encoding=encoding, newline="")
+
+        with open(path, "rb") as f:
+            content = f.read()
+        if self.binary:
+            return content
+        return str(content, encoding, errors="replace")
+
+    def open_stream(self, resp):
+        "Wrap a streaming response as a file-like object"
+        resp.raw.decode_content = True
+        # Don't report the response as closed as soon as it is exhausted,
+        # since TextIOWrapper may still have buffered data to read
+        resp.raw.auto_close = False
+        if self.binary:
+            return resp.raw
+        return TextIOWrapper(
+            resp.raw,
+            encoding=resp.encoding or "utf-8",
+            newline="",
+        )
+
+    def GET(self, **kwargs):
+        return self.req(method="GET", **kwargs)
+
+    def POST(self, **kwargs):
+        return self.req(method="POST", **kwargs)
+
+    def PUT(self, **kwargs):
+        return self.req(method="PUT", **kwargs)
+
+    def DELETE(self, **kwargs):
+        return self.req(method="DELETE", **kwargs)
+
+
+class AsyncNetLoader(NetLoader):
+    """
+    NetLoader for use with asyncio (see BaseIter.aload()).  Requests are made
+    with a shared httpx.AsyncClient, or async_client if set (any object with
+    a compatible async request() method).  load() still works synchronously
+    via NetLoader, using the regular client.
+    """
+
+    async_client = None
+
+    def get_async_client(self):
+        if self.async_client is not None:
+            return self.async_client
+        return get_async_client()
+
+    async def load_async(self):
+        result = await self.areq(method="GET")
+        self.file = self._io_class(result)
+
+    async def areq(
+        self,
+        url=None,
+        method=None,
+        params=None,
+        body=None,
+        headers={},
+    ):
+        url, params, all_headers, auth = self.prepare_request(
+            url, method, params, headers
+        )
+        options = dict(
             params=params,
             headers=all_headers,
             auth=auth,
-            data=body,
+            content=body,
         )
-        resp.connection.close()
+        client = self.get_async_client()
+        resp = await client.request(method, url, **options)
 
         if resp.status_code < 200 or resp.status_code > 299:
             raise LoadFailed(
@@ -185,22 +594,32 @@ class NetLoader(StringLoader):
         else:
             return resp.text
 
-    def GET(self, **kwargs):
-        return self.req(method="GET", **kwargs)
+    async def aGET(self, **kwargs):
+        return await self.areq(method="GET", **kwargs)
 
-    def POST(self, **kwargs):
-        return self.req(method="POST", **kwargs)
+    async def aPOST(self, **kwargs):
+        return await self.areq(method="POST", **kwargs)
 
-    def PUT(self, **kwargs):
-        return self.req(method="PUT", **kwargs)
+    async def aPUT(self, **kwargs):
+        return await self.areq(method="PUT", **kwargs)
 
-    def DELETE(self, **kwargs):
-        return self.req(method="DELETE", **kwargs)
+    async def aDELETE(self, **kwargs):
+        return await self.areq(method="DELETE", **kwargs)
 
 
 class ZipNetLoader(Zipper, NetLoader):
     binary = True
 
     def load(self):
-        super(ZipNetLoader, self).load()
+        if self.string:
+            # Archive was already downloaded (e.g. by a nested parent Iter)
+            StringLoader.load(self)
+        else:
+            # ZIP archives require random access, so always download in full
+            self.file = self._io_class(self.GET())
         self.unzip_file()
+
+    def get_inner_options(self, name):
+        options = super(ZipNetLoader, self).get_inner_options(name)
+        options["string"] = self.file.getvalue()
+        return options
@@ -1,4 +1,5 @@
 from collections import namedtuple, OrderedDict
+from operator import itemgetter
 import re
 from datetime import datetime
 from .exceptions import NoData, MappingFailed
@@ -37,10 +38,22 @@ class BaseMapper(object):
             item[key] = val
         return item
 
+    def map_column(self, field, values):
+        return [self.map_value(field, value) for value in values]
+
+    def usable_columns(self, columns):
+        ucolumns = {}
+        for key, values in columns.items():
+            field = self.map_field(key)
+            ucolumns[field] = self.map_column(field, values)
+        return ucolumns
+
 
 class DictMapper(BaseMapper):
     field_map = {}
     value_map = {}
+    no_pickle_mapper = ["_inverse_maps", "_item_inverse_maps"]
+    _item_inverse_maps = None
 
     def map_field(self, field):
         field = self.field_map[field] if field in self.field_map else field
@@ -52,23 +65,76 @@ class DictMapper(BaseMapper):
         value = self.value_map[value] if value in self.value_map else value
         return value
 
+    @property
+    def maps_values(self):
+        "Whether map_value() does anything besides return the value as-is"
+        return bool(
+            type(self).map_value is not DictMapper.map_value or self.value_map
+        )
+
+    def map_column(self, field, values):
+        if not self.maps_values:
+            return values
+        return super(DictMapper, self).map_column(field, values)
+
+    def parse_usable_item(self, uitem):
+        if self._item_inverse_maps is not None:
+            return super(DictMapper, self).parse_usable_item(uitem)
+        # Check the inverse maps once per item, rather than for every value
+        self._item_inverse_maps = {
+            "field_map": self.get_inverse_map("field_map"),
+            "value_map": self.get_inverse_map("value_map"),
+        }
+        try:
+            return super(DictMapper, self).parse_usable_item(uitem)
+        finally:
+            self._item_inverse_maps = None
+
     def unmap_field(self, field):
-        for f in self.field_map:
-            if self.field_map[f] == field:
-                return f
-        return field
+        return self.get_item_inverse_map("field_map").get(field, field)
 
     def unmap_value(self, field, value):
         if not isinstance(value, str):
             return value
-        for v in self.value_map:
-            if self.value_map[v] == value:
-                return v
-        return value
+        return self.get_item_inverse_map("value_map").get(value, value)
+
+    def get_item_inverse_map(self, name):
+        if self._item_inverse_maps is not None:
+            return self._item_inverse_maps[name]
+        return self.get_inverse_map(name)
+
+    def get_inverse_map(self, name):
+        """
+        Returns a cached reverse lookup for field_map or value_map.  The cache
+        is rebuilt whenever the map is replaced or modified.
+        """
+        current = getattr(self, name)
+        cache = getattr(self, "_inverse_maps", None)
+        if cache is None:
+            cache = self._inverse_maps = {}
+        if name in cache:
+            snapshot, inverse = cache[name]
+            if snapshot == current:
+                return inverse
+
+        inverse = {}
+        for key, value in current.items():
+            try:
+                # First match wins, as with a linear scan
+                inverse.setdefault(value, key)
+            except TypeError:
+                # Unhashable values can't be looked up anyway
+                pass
+        cache[name] = dict(current), inverse
+        return inverse
 
 
 class TupleMapper(DictMapper):
-    no_pickle_mapper = ["_tuple_class", "_tuple_prototype"]
+    no_pickle_mapper = DictMapper.no_pickle_mapper + [
+        "_tuple_class",
+        "_tuple_prototype",
+        "_item_converter",
+    ]
 
     @property
     def field_map(self):
@@ -115,7 +181,62 @@ class TupleMapper(DictMapper):
             self._tuple_prototype = self.tuple_class(**vals)
         return self._tuple_prototype
 
+    @property
+    def item_converter(self):
+        "Returns a function to convert raw items directly into tuples"
+        if not hasattr(self, "_item_converter"):
+            self._item_converter = self.compile_item_converter()
+        return self._item_converter
+
+    def compile_item_converter(self):
+        """
+        Precompute a positional converter for items that contain exactly the
+        expected raw fields.  Returns None if map_field() is customized.
+        """
+        if type(self).map_field is not DictMapper.map_field:
+            return None
+
+        keys = list(self.field_map.keys())
+        fields = list(self.field_map.values())
+        size = len(keys)
+        if size == 0:
+            return None
+        elif size == 1:
+            key = keys[0]
+
+            def get_values(item):
+                return (item[key],)
+
+        else:
+            get_values = itemgetter(*keys)
+
+        make = self.tuple_class._make
+
+        if self.maps_values:
+            map_value = self.map_value
+
+            def convert(item):
+                if len(item) != size:
+                    raise KeyError
+                return make(map(map_value, fields, get_values(item)))
+
+        else:
+
+            def convert(item):
+                if len(item) != size:
+                    raise KeyError
+                return make(get_values(item))
+
+        return convert
+
     def usable_item(self, item):
+        convert = self.item_converter
+        if convert is not None:
+            try:
+                return convert(item)
+            except KeyError:
+                # Missing or unexpected fields, use the general approach below
+                pass
         mapped = super(TupleMapper, self).usable_item(item)
         try:
             return self.tuple_prototype._replace(**mapped)
@@ -174,30 +295,126 @@ class TimeSeriesMapper(TupleMapper):
     date_formats = None
     map_floats = True
     map_functions = []
+    lock_types_after = None
+    _default_map_functions = None
 
     def make_date_mapper(self, fmt):
         return make_date_mapper(fmt)
 
     def map_value(self, field, value):
+        """
+        Convert string values via the first of map_functions that succeeds.
+        The last successful function for each field is tried first, and (if
+        lock_types_after is set) is used exclusively once it has succeeded
+        that many times in a row.
+        """
         if not isinstance(value, str):
             return value
 
-        if not self.map_functions:
-            self.map_functions = [
-                self.make_date_mapper(fmt) for fmt in self.date_formats
-            ]
+        map_functions = self.get_map_functions()
 
-            if self.map_floats:
-                self.map_functions.insert(0, float)
+        field_types = getattr(self, "_field_types", None)
+        if field_types is None:
+            field_types = self._field_types = {}
 
         value = value.strip()
-        for i, fn in enumerate(self.map_functions):
+        last = field_types.get(field)
+        if last is not None:
             try:
-                return fn(value)
+                result = map_functions[last[0]](value)
+            except ValueError:
+                if self.lock_types_after and last[1] >= self.lock_types_after:
+                    return value
+            else:
+                last[1] += 1
+                return result
+
+        for i, fn in enumerate(map_functions):
+            if last is not None and i == last[0]:
+                continue
+            try:
+                result = fn(value)
             except ValueError:
                 pass
+            else:
+                field_types[field] = [i, 1]
+                return result
         return value
 
+    def get_map_functions(self):
+        """
+        Returns map_functions if set, otherwise a (cached) default list built
+        from date_formats and map_floats.
+        """
+        if self.map_functions:
+            return self.map_functions
+        if self._default_map_functions is None:
+            functions = [
+                self.make_date_mapper(fmt) for fmt in self.date_formats
+            ]
+            if self.map_floats:
+                functions.insert(0, float)
+            self._default_map_functions = functions
+        return self._default_map_functions
+
+    def map_column(self, field, values):
+        """
+        Vectorized equivalent of map_value() for an entire column (used by
+        as_dataframe()).  Falls back to converting each value individually if
+        the column cannot be converted as a whole.
+        """
+        try:
+            import pandas
+        except ImportError:
+            pandas = None
+
+        cls = type(self)
+        if (
+            pandas is None
+            or cls.map_value is not TimeSeriesMapper.map_value
+            or cls.make_date_mapper is not TimeSeriesMapper.make_date_mapper
+            or cls.get_map_functions is not TimeSeriesMapper.get_map_functions
+            or self.map_functions
+        ):
+            return super(TimeSeriesMapper, self).map_column(field, values)
+
+        series = pandas.Series(values, dtype=object)
+        strings = series.str.strip()
+        if strings.isna().sum() != series.isna().sum():
+            # Not all values are strings
+            return super(TimeSeriesMapper, self).map_column(field, values)
+
+        # Blank values are left as-is by map_value()
+        blank = strings.eq("")
+        present = strings[~blank]
+        if present.isna().all():
+            return super(TimeSeriesMapper, self).map_column(field, values)
+
+        result = None
+        if self.map_floats:
+            try:
+                result = pandas.to_numeric(present).astype(float)
+            except (ValueError, TypeError):
+                pass
+
+        for fmt in self.date_formats or []:
+            if result is not None:
+                break
+            if fmt == "iso8601" or ("%Y" not in fmt and "%y" not in fmt):
+                # Not supported by to_datetime(), convert individually
+                break
+            try:
+                result = pandas.to_datetime(present, format=fmt)
+            except (ValueError, TypeError):
+                pass
+
+        if result is None:
+            return super(TimeSeriesMapper, self).map_column(field, values)
+
+        if blank.any():
+            result = result.astype(object).reindex(series.index, fill_value="")
+        return result
+
     @property
     def key_fields(self):
         raise NotImplementedError("Key fields must be specified")
@@ -1,7 +1,49 @@
+from collections.abc import Sequence
 import csv
+import io
+import itertools
+import json
+import re
 
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+DELIMITERS = (",", ":", "]", "}")
 
-class SkipPreludeReader(csv.DictReader):
+
+class DictReader(csv.DictReader):
+    """
+    A version of DictReader that can include only the given columns in each
+    row, skipping other values instead of adding them to the dict.
+    """
+
+    def __init__(self, *args, columns=None, **kwds):
+        self.columns = columns
+        self._projection = None
+        super().__init__(*args, **kwds)
+
+    def __next__(self):
+        if self.columns is None:
+            return super().__next__()
+        if self._projection is None:
+            # (Also finds the header row, which may replace self.reader)
+            columns = set(self.columns)
+            self._projection = [
+                (i, name)
+                for i, name in enumerate(self.fieldnames)
+                if name in columns
+            ]
+        row = next(self.reader)
+        while row == []:
+            row = next(self.reader)
+        self.line_num = self.reader.line_num
+        size = len(row)
+        restval = self.restval
+        return {
+            name: row[i] if i < size else restval
+            for i, name in self._projection
+        }
+
+
+class SkipPreludeReader(DictReader):
     """
     A specialized version of DictReader that attempts to find where the "real"
     CSV data is in a file that may contain a prelude of non-CSV text.
@@ -21,13 +63,21 @@ class SkipPreludeReader(csv.DictReader):
     ):
         # Preserve file since we're going to start reading it
         self._file = f
+        columns = kwds.pop("columns", None)
 
         # Preserve reader options since we'll need to make another one
         readeropts = [f, dialect]
         readeropts.extend(args)
         self._readeropts = (readeropts, kwds)
         super().__init__(
-            f, fieldnames, restkey, restval, dialect, *args, **kwds
+            f,
+            fieldnames,
+            restkey,
+            restval,
+            dialect,
+            *args,
+            columns=columns,
+            **kwds
         )
 
     @property
@@ -35,9 +85,19 @@ class SkipPreludeReader(csv.DictReader):
         if self._fieldnames is not None:
             return self._fieldnames
 
-        # Create a new reader just to figure out which row is the header
+        # Create a new reader just to figure out which row is the header,
+        # keeping the lines it reads so they can be replayed (rather than
+        # seeking, which is not possible with e.g. streaming downloads)
         args, kwds = self._readeropts
-        data = csv.reader(*args, **kwds)
+        lines = []
+        source = iter(self._file)
+
+        def record():
+            for line in source:
+                lines.append(line)
+                yield line
+
+        data = csv.reader(record(), *args[1:], **kwds)
         rows = []
         for i in range(self.max_header_row):
             try:
@@ -46,9 +106,10 @@ class SkipPreludeReader(csv.DictReader):
                 pass
         header_row, field_names = self.choose_header(rows)
 
-        # Reset file and advance reader so it starts in the right spot
-        if hasattr(self._file, "seek"):
-            self._file.seek(0)
+        # Restart reader and advance it so it starts in the right spot
+        self.reader = csv.reader(
+            itertools.chain(lines, source), *args[1:], **kwds
+        )
         for i in range(header_row + 1):
             try:
                 next(self.reader)
@@ -78,3 +139,229 @@ class SkipPreludeReader(csv.DictReader):
                 header_row = i
                 field_names = row
         return header_row, field_names
+
+
+def open_binary(filename, memory_map=False):
+    if memory_map:
+        from ..loaders import MemoryMapIO
+
+        return MemoryMapIO(filename)
+    return open(filename, "rb")
+
+
+def iter_record_offsets(f, encoding, *args, **kwds):
+    """
+    Read CSV records from a binary file, yielding each record along with the
+    byte offset at its end (i.e. where the next record starts).
+    """
+    pos = f.tell()
+
+    def lines():
+        nonlocal pos
+        for line in iter(f.readline, b""):
+            pos += len(line)
+            yield line.decode(encoding)
+
+    for row in csv.reader(lines(), *args, **kwds):
+        yield row, pos
+
+
+def split_records(f, start, end, count, quotechar='"', block_size=2**20):
+    """
+    Split the byte range [start, end) of a binary CSV file into at most count
+    (start, end) ranges of similar size.  Ranges end on a newline that is not
+    within a quoted value.  Assumes an ASCII-compatible encoding and the
+    default doublequote escaping (so that quote characters come in pairs).
+    """
+    quote = quotechar.encode("ascii")
+    targets = [start + (end - start) * i // count for i in range(1, count)]
+    boundaries = [start]
+    quoted = False
+    pos = start
+    f.seek(start)
+    while targets:
+        block = f.read(block_size)
+        if not block:
+            break
+        i = 0
+        while targets:
+            j = block.find(b"\n", max(targets[0] - pos, i))
+            if j == -1:
+                break
+            quoted ^= block.count(quote, i, j) % 2 == 1
+            i = j + 1
+            if not quoted:
+                boundaries.append(min(pos + i, end))
+                while targets and targets[0] < pos + i:
+                    targets.pop(0)
+        quoted ^= block.count(quote, i) % 2 == 1
+        pos += len(block)
+    boundaries.append(end)
+    return [
+        (start, stop)
+        for start, stop in zip(boundaries, boundaries[1:])
+        if start < stop
+    ]
+
+
+class IndexedCsvRows(Sequence):
+    """
+    Read-only sequence of CSV rows (as dicts) backed by an index of the byte
+    offsets where each row starts.  Rows are parsed from the file on demand.
+    """
+
+    def __init__(
+        self,
+        filename,
+        offsets,
+        end,
+        field_names,
+        encoding,
+        options,
+        memory_map=False,
+        columns=None,
+    ):
+        self.filename = filename
+        self.offsets = offsets
+        self.end = end
+        self.field_names = field_names
+        self.encoding = encoding
+        self.options = options
+        self.memory_map = memory_map
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = range(len(self.offsets))[index]
+        start = self.offsets[index]
+        if index + 1 < len(self.offsets):
+            end = self.offsets[index + 1]
+        else:
+            end = self.end
+        with open_binary(self.filename, self.memory_map) as f:
+            f.seek(start)
+            content = f.read(end - start)
+        return next(self.read(io.BytesIO(content)))
+
+    def __iter__(self):
+        if not self.offsets:
+            return
+        f = open_binary(self.filename, self.memory_map)
+        f.seek(self.offsets[0])
+        with io.TextIOWrapper(f, self.encoding) as f:
+            yield from self.get_reader(f)
+
+    def read(self, f):
+        return self.get_reader(io.TextIOWrapper(f, self.encoding))
+
+    def get_reader(self, f):
+        return DictReader(
+            f, self.field_names, columns=self.columns, **self.options
+        )
+
+
+class JsonItemReader(object):
+    """
+    Incrementally reads the items of a JSON array (optionally nested within
+    objects at the given path of keys) from a text file, without loading the
+    entire document.
+    """
+
+    chunk_size = 2**16
+
+    def __init__(self, f, path=None):
+        self.file = f
+        self.path = path or []
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def read_more(self):
+        if self.eof:
+            return False
+        if self.pos > self.chunk_size:
+            # Discard consumed text
+            self.buffer = self.buffer[self.pos :]
+            self.pos = 0
+        chunk = self.file.read(self.chunk_size)
+        if chunk:
+            self.buffer += chunk
+        else:
+            self.eof = True
+        return bool(chunk)
+
+    def peek(self):
+        "Skip whitespace and return the next character (or '' at EOF)"
+        while True:
+            match = WHITESPACE.match(self.buffer, self.pos)
+            self.pos = match.end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.read_more():
+                return ""
+
+    def expect(self, *chars):
+        char = self.peek()
+        if char not in chars:
+            raise json.JSONDecodeError(
+                "Expected %s" % " or ".join(map(repr, chars)),
+                self.buffer,
+                self.pos,
+            )
+        self.pos += 1
+        return char
+
+    def decode(self):
+        "Decode the next value in the document"
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.read_more():
+                    continue
+                raise
+            # Numbers may continue past the end of the buffer, so only accept
+            # the value if it is followed by a delimiter (or the end of file)
+            next_pos = WHITESPACE.match(self.buffer, end).end()
+            if self.buffer[next_pos : next_pos + 1] not in DELIMITERS:
+                if self.read_more():
+                    continue
+            self.pos = end
+            return value
+
+    def find_path(self):
+        for key in self.path:
+            self.expect("{")
+            if self.peek() == "}":
+                raise KeyError(key)
+            while True:
+                name = self.decode()
+                self.expect(":")
+                if name == key:
+                    break
+                self.decode()
+                if self.expect(",", "}") == "}":
+                    raise KeyError(key)
+
+    def __iter__(self):
+        self.find_path()
+        self.expect("[")
+        if self.peek() == "]":
+            return
+        while True:
+            yield self.decode()
+            if self.expect(",", "]") == "]":
+                return
+
+
+def iter_json_lines(f):
+    "Read items from a JSON Lines (NDJSON) text file"
+    for line in f:
+        if line.strip():
+            yield json.loads(line)
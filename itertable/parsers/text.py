@@ -1,10 +1,30 @@
 import csv
+import io
+import itertools
 import json
-from .readers import SkipPreludeReader
+import os
+import struct
+import sys
+from array import array
+from .readers import (
+    DictReader,
+    SkipPreludeReader,
+    IndexedCsvRows,
+    JsonItemReader,
+    iter_json_lines,
+    iter_record_offsets,
+    split_records,
+    open_binary,
+)
 from xml.etree import ElementTree as ET
 
 from .base import BaseParser, TableParser
-from ..exceptions import ParseFailed
+from ..exceptions import ParseFailed, ReadOnly
+
+# Offset index files (see CsvParser.persist_offset_index) consist of a header
+# (magic, file size, file mtime, row count) followed by little-endian offsets
+OFFSET_INDEX_MAGIC = b"ITIDX001"
+OFFSET_INDEX_HEADER = struct.Struct("<8sqqq")
 
 
 class CsvParser(TableParser):
@@ -12,11 +32,214 @@ class CsvParser(TableParser):
     quotechar = '"'
     no_pickle_parser = ["csvdata"]
     binary = False
+    column_chunk_size = 10000
+
+    # Parse large files in chunks across a pool of worker processes
+    parse_processes = None
+    parallel_min_size = 2**27
+
+    # Index the byte offset of each row, rather than parsing all rows up
+    # front.  The data becomes a read-only sequence that parses rows on
+    # demand.  If persist_offset_index is set, the index is saved alongside
+    # the file (as [filename].idx) and reused while the file is unchanged.
+    offset_index = False
+    persist_offset_index = False
 
     def parse(self):
+        self.init_reader()
+        if self.offset_index and self.is_local_file():
+            self.data = self.parse_offset_index()
+        elif self.use_parallel_parse():
+            self.data = self.parse_parallel()
+        else:
+            self.data = [row for row in self.csvdata]
+
+    def check_writable(self):
+        super(CsvParser, self).check_writable()
+        if self.offset_index:
+            self.require_data()
+            if isinstance(self.data, IndexedCsvRows):
+                raise ReadOnly("Offset-indexed data cannot be modified")
+
+    def is_local_file(self):
+        # Only plain files opened by FileLoader can be reopened by name
+        filename = getattr(self, "filename", None)
+        if self.stream or not filename:
+            return False
+        return getattr(self.file, "name", None) == filename
+
+    def use_parallel_parse(self):
+        if not self.parse_processes or not self.is_local_file():
+            return False
+        return os.path.getsize(self.filename) >= self.parallel_min_size
+
+    @property
+    def reader_options(self):
+        return {
+            "delimiter": self.delimiter,
+            "quotechar": self.quotechar,
+        }
+
+    def find_data_offset(self, f):
+        "Returns the byte offset where the data starts (after the header)"
+        start = 0
+        if self.header_row is not None:
+            records = iter_record_offsets(
+                f, self.file.encoding, **self.reader_options
+            )
+            for row, start in itertools.islice(records, self.header_row + 1):
+                pass
+        return start
+
+    def parse_offset_index(self):
+        stat = os.stat(self.filename)
+        memory_map = getattr(self, "memory_map", False)
+        offsets = None
+        if self.persist_offset_index:
+            offsets = self.load_offset_index(stat)
+
+        if offsets is None:
+            offsets = array("q")
+            with open_binary(self.filename, memory_map) as f:
+                start = self.find_data_offset(f)
+                f.seek(start)
+                records = iter_record_offsets(
+                    f, self.file.encoding, **self.reader_options
+                )
+                for row, end in records:
+                    # Like DictReader, skip blank rows
+                    if row:
+                        offsets.append(start)
+                    start = end
+            if self.persist_offset_index:
+                self.save_offset_index(stat, offsets)
+
+        return IndexedCsvRows(
+            self.filename,
+            offsets,
+            stat.st_size,
+            self.field_names,
+            self.file.encoding,
+            self.reader_options,
+            memory_map,
+            self.columns,
+        )
+
+    @property
+    def offset_index_filename(self):
+        return self.filename + ".idx"
+
+    def load_offset_index(self, stat):
+        offsets = array("q")
+        try:
+            with open(self.offset_index_filename, "rb") as f:
+                header = f.read(OFFSET_INDEX_HEADER.size)
+                magic, size, mtime, count = OFFSET_INDEX_HEADER.unpack(header)
+                if magic != OFFSET_INDEX_MAGIC:
+                    return None
+                if (size, mtime) != (stat.st_size, stat.st_mtime_ns):
+                    return None
+                offsets.fromfile(f, count)
+        except (OSError, EOFError, ValueError, struct.error):
+            return None
+        if sys.byteorder != "little":
+            offsets.byteswap()
+        return offsets
+
+    def save_offset_index(self, stat, offsets):
+        if sys.byteorder != "little":
+            offsets = array("q", offsets)
+            offsets.byteswap()
+        with open(self.offset_index_filename, "wb") as f:
+            f.write(
+                OFFSET_INDEX_HEADER.pack(
+                    OFFSET_INDEX_MAGIC,
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    len(offsets),
+                )
+            )
+            offsets.tofile(f)
+
+    def parse_parallel(self):
+        from concurrent.futures import ProcessPoolExecutor
+
+        options = self.reader_options
+        encoding = self.file.encoding
+        memory_map = getattr(self, "memory_map", False)
+        with open_binary(self.filename, memory_map) as f:
+            start = self.find_data_offset(f)
+            end = os.path.getsize(self.filename)
+            chunks = split_records(
+                f, start, end, self.parse_processes, self.quotechar
+            )
+
+        data = []
+        with ProcessPoolExecutor(self.parse_processes) as executor:
+            futures = [
+                executor.submit(
+                    _parse_chunk,
+                    self.filename,
+                    chunk_start,
+                    chunk_end,
+                    self.field_names,
+                    encoding,
+                    options,
+                    memory_map,
+                    self.columns,
+                )
+                for chunk_start, chunk_end in chunks
+            ]
+            for future in futures:
+                data.extend(future.result())
+        return data
+
+    def parse_stream(self):
+        self.init_reader()
+        yield from self.csvdata
+
+    def parse_columns(self):
+        if self.parsed or not self.stream:
+            return super(CsvParser, self).parse_columns()
+
+        # Read rows positionally and transpose them in chunks, rather than
+        # creating a dict for every row.
+        if not self.loaded:
+            self.load()
+            self.loaded = True
+        try:
+            self.init_reader()
+            size = len(self.field_names)
+            columns = [[] for field in self.field_names]
+            reader = self.csvdata.reader
+            while True:
+                rows = list(itertools.islice(reader, self.column_chunk_size))
+                if not rows:
+                    break
+                # Like DictReader, skip blank rows and pad short rows
+                rows = [row for row in rows if row]
+                for i, row in enumerate(rows):
+                    if len(row) < size:
+                        rows[i] = row + [None] * (size - len(row))
+                    elif len(row) > size:
+                        raise ParseFailed(
+                            "Row has more values than field names"
+                        )
+                for column, values in zip(columns, zip(*rows)):
+                    column.extend(values)
+        finally:
+            self.close_file()
+            self.loaded = False
+        return {
+            name: values
+            for name, values in zip(self.field_names, columns)
+            if self.columns is None or name in self.columns
+        }
+
+    def init_reader(self):
         # Like DictReader, assume explicit field definition means CSV does not
         # contain column headers.
-        fields = self.get_field_names()
+        fields = self.get_all_field_names()
         if self.start_row is None:
             if fields:
                 self.start_row = 0
@@ -27,6 +250,10 @@ class CsvParser(TableParser):
                 self.header_row = None
             else:
                 self.header_row = 0
+        elif self.stream:
+            # Field names were detected on a previous pass; detect them again
+            # so the header row is skipped.
+            fields = None
 
         Reader = self.reader_class()
         self.csvdata = Reader(
@@ -34,11 +261,11 @@ class CsvParser(TableParser):
             fields,
             delimiter=self.delimiter,
             quotechar=self.quotechar,
+            columns=self.columns,
         )
         self.field_names = self.csvdata.fieldnames
         if self.header_row is not None:
             self.header_row = self.csvdata.header_row
-        self.data = [row for row in self.csvdata]
         self.extra_data = {}
 
     def reader_class(self):
@@ -47,18 +274,35 @@ class CsvParser(TableParser):
 
         return Reader
 
-    def dump(self, file=None):
+    def dump(self, file=None, data=None):
         if file is None:
             file = self.file
+        field_names, rows = self.get_dump_rows(data)
         csvout = csv.DictWriter(
             file,
-            self.get_field_names(),
+            field_names,
             delimiter=self.delimiter,
             quotechar=self.quotechar,
         )
         csvout.writeheader()
-        for row in self.data:
-            csvout.writerow(row)
+        csvout.writerows(rows)
+
+
+def _parse_chunk(
+    filename,
+    start,
+    end,
+    field_names,
+    encoding,
+    options,
+    memory_map=False,
+    columns=None,
+):
+    "Parse a byte range of a CSV file (see CsvParser.parse_parallel())"
+    with open_binary(filename, memory_map) as f:
+        f.seek(start)
+        chunk = io.TextIOWrapper(io.BytesIO(f.read(end - start)), encoding)
+    return list(DictReader(chunk, field_names, columns=columns, **options))
 
 
 class JsonParser(BaseParser):
@@ -66,23 +310,63 @@ class JsonParser(BaseParser):
     namespace = None
     binary = False
 
+    # Read (and write) JSON Lines / NDJSON, with one item per line
+    json_lines = False
+
     def parse(self):
         try:
-            obj = json.load(self.file)
-            if self.namespace:
-                for key in self.namespace.split("."):
-                    obj = obj[key]
-            self.data = list(map(self.parse_item, obj))
+            if self.json_lines:
+                obj = iter_json_lines(self.file)
+            else:
+                obj = json.load(self.file)
+                if self.namespace:
+                    for key in self.namespace.split("."):
+                        obj = obj[key]
+            self.data = list(self.parse_items(obj))
+        except ValueError:
+            raise ParseFailed
+
+    def parse_stream(self):
+        # Read items one at a time rather than loading the whole document
+        if self.json_lines:
+            items = iter_json_lines(self.file)
+        elif self.namespace:
+            items = JsonItemReader(self.file, self.namespace.split("."))
+        else:
+            items = JsonItemReader(self.file)
+        try:
+            for item in self.parse_items(items):
+                if self._auto_field_names is None and isinstance(item, dict):
+                    self._auto_field_names = list(item.keys())
+                yield item
         except ValueError:
             raise ParseFailed
 
+    def parse_items(self, items):
+        items = map(self.parse_item, items)
+        if self.columns is not None:
+            # Keep only the requested columns
+            columns = set(self.columns)
+            items = (
+                {key: val for key, val in item.items() if key in columns}
+                if isinstance(item, dict)
+                else item
+                for item in items
+            )
+        return items
+
     def parse_item(self, item):
         return item
 
-    def dump(self, file=None):
+    def dump(self, file=None, data=None):
         if file is None:
             file = self.file
-        obj = list(map(self.dump_item, self.data))
+        rows = self.get_dump_data(data)
+        if self.json_lines:
+            for item in map(self.dump_item, rows):
+                file.write(json.dumps(item) + "\n")
+            return
+        obj = JsonArray(map(self.dump_item, rows))
         if self.namespace:
             for key in reversed(self.namespace.split(".")):
                 obj = {key: obj}
@@ -92,6 +376,25 @@ class JsonParser(BaseParser):
         return item
 
 
+class JsonArray(list):
+    """
+    Wraps an iterator so json.dump() can write it as an array without first
+    loading every item into memory.
+    """
+
+    def __init__(self, items):
+        self.items = iter(items)
+        self.first = next(self.items, self)
+
+    def __bool__(self):
+        return self.first is not self
+
+    def __iter__(self):
+        if self:
+            yield self.first
+            yield from self.items
+
+
 class XmlParser(BaseParser):
     root_tag = None
     item_tag = None
@@ -106,6 +409,38 @@ class XmlParser(BaseParser):
             self.item_tag = list(root)[0].tag
         self.data = list(map(self.parse_item, root.findall(self.item_tag)))
 
+    def parse_stream(self):
+        # Parse items as they are read, discarding each one once processed
+        stack = []
+        container = None
+        for event, el in ET.iterparse(self.file, events=("start", "end")):
+            if event == "start":
+                stack.append(el)
+                if container is None:
+                    if len(stack) == 1 and self.root_tag in (None, el.tag):
+                        container = el
+                    elif len(stack) == 2 and el.tag == self.root_tag:
+                        container = el
+                    if container is not None:
+                        self.root_tag = el.tag
+                        depth = len(stack)
+                elif len(stack) == depth + 1 and self.item_tag is None:
+                    self.item_tag = el.tag
+                continue
+
+            stack.pop()
+            if el is container:
+                break
+            if container is None or len(stack) != depth:
+                continue
+            if el.tag == self.item_tag:
+                item = self.parse_item(el)
+                if self._auto_field_names is None and isinstance(item, dict):
+                    self._auto_field_names = list(item.keys())
+                yield item
+            container.remove(el)
+            el.clear()
+
     def parse_root(self, doc):
         root = doc.getroot()
         if self.root_tag is not None and root.tag != self.root_tag:
@@ -113,20 +448,29 @@ class XmlParser(BaseParser):
         return root
 
     def parse_item(self, el):
+        if self.columns is not None:
+            return {e.tag: e.text for e in el if e.tag in self.columns}
         return {e.tag: e.text for e in el}
 
-    def dump(self, file=None):
+    def dump(self, file=None, data=None):
+        # Write one element at a time rather than building the whole tree
         if file is None:
             file = self.file
-        root = ET.Element(self.root_tag)
-        for item in self.data:
-            root.append(self.dump_item(item))
-        output = ET.tostring(root).decode("utf-8")
-        file.write(output)
+        field_names, rows = self.get_dump_rows(data)
+        empty = True
+        for item in rows:
+            if empty:
+                file.write("<%s>" % self.root_tag)
+                empty = False
+            file.write(ET.tostring(self.dump_item(item), encoding="unicode"))
+        if empty:
+            file.write("<%s />" % self.root_tag)
+        else:
+            file.write("</%s>" % self.root_tag)
 
     def dump_item(self, item):
         el = ET.Element(self.item_tag)
-        for key in self.get_field_names():
+        for key in self.get_field_names() or item:
             if key not in item or item[key] is None:
                 continue
             sel = ET.SubElement(el, key)
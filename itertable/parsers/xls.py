@@ -1,15 +1,47 @@
+import copy
 import datetime
+import itertools
 import math
 from .base import TableParser
 
 
+def char_width(c):
+    "Approximate relative display width of a character"
+    if c in ".,;:'\"iIlt1":
+        return 0.5
+    elif c in "MW":
+        return 1.3
+    elif c.isupper():
+        return 1.2
+    elif c.islower():
+        return 1
+    else:
+        return 1.1
+
+
+ASCII_WIDTHS = {chr(i): char_width(chr(i)) for i in range(128)}
+
+
+def text_width(val):
+    "Approximate display width of a value (used to size columns)"
+    val = str(val) if val is not None else ""
+    if val.isascii():
+        return sum(map(ASCII_WIDTHS.__getitem__, val))
+    return sum(map(char_width, val))
+
+
 class WorkbookParser(TableParser):
     workbook = None
     worksheet = None
     sheet_name = 0
     start_row = None
     column_count = None
-    no_pickle_parser = ["workbook", "worksheet"]
+    no_pickle_parser = ["workbook", "worksheet", "_owns_workbook"]
+    _owns_workbook = False
+
+    # With sheet_name = None, each sheet is a row with a lazily loaded Iter
+    # as its data.  If max_workers is set, the sheets are parsed concurrently.
+    max_workers = None
     binary = True
 
     date_format = "yyyy-mm-dd"
@@ -17,22 +49,31 @@ class WorkbookParser(TableParser):
     datetime_format = "yyyy-mm-dd hh:mm:ss"
 
     def parse(self):
+        self.data = list(self.parse_rows())
+
+    def parse_stream(self):
+        return self.parse_rows()
+
+    def parse_rows(self):
         if not self.workbook:
             self.parse_workbook()
+            self._owns_workbook = True
 
         if self.sheet_name is None:
             SpreadsheetIter = type(self)
             self.data = [
                 {
                     "name": name,
-                    "data": SpreadsheetIter(
-                        loaded=True,
-                        workbook=self.workbook,
-                        sheet_name=name,
-                    ),
+                    "data": SpreadsheetIter(**self.get_sheet_options(name)),
                 }
                 for name in self.sheet_names
             ]
+            if self.max_workers:
+                self.preload_nested(self.max_workers)
+            if self.share_workbook:
+                # Leave workbook open for the (lazily loaded) sheets
+                self._owns_workbook = False
+            yield from self.data
             return
 
         sheet_name = self.sheet_name
@@ -41,20 +82,25 @@ class WorkbookParser(TableParser):
 
         self.parse_worksheet(sheet_name)
 
+        # Only the rows up to the header (or start row) need to be kept in
+        # memory; the remaining rows are parsed as they are read.
+        rows = iter(self.worksheet)
+        window = max(
+            self.max_header_row + 1,
+            self.start_row or 0,
+            self.header_row + 1 if self.header_row is not None else 0,
+        )
+        head = list(itertools.islice(rows, window))
+
         if self.header_row is None:
             if self.start_row is not None:
                 self.header_row = self.start_row - 1
             else:
                 self.column_count = 0
-
-                def checkval(cell):
-                    if cell.value is not None and cell.value != "":
-                        return True
-                    return False
-
-                search_rows = min(len(self.worksheet) - 1, self.max_header_row)
+                search_rows = min(len(head) - 1, self.max_header_row)
                 for row in range(search_rows, -1, -1):
-                    count = len(list(filter(checkval, self.worksheet[row])))
+                    values = self.get_raw_values(head[row])
+                    count = len(values) - values.count(None) - values.count("")
                     if count >= self.column_count:
                         self.column_count = count
                         self.header_row = row
@@ -66,13 +112,14 @@ class WorkbookParser(TableParser):
             self.start_row = self.header_row + 1
 
         if self.field_names is None:
-            rows = self.worksheet[self.header_row : self.start_row]
+            header = head[self.header_row : self.start_row]
             self.field_names = [
-                str(c.value) or "c%s" % i for i, c in enumerate(rows[0])
+                str(self.get_raw_value(c)) or "c%s" % i
+                for i, c in enumerate(header[0])
             ]
-            for row in rows[1:]:
+            for row in header[1:]:
                 for i, c in enumerate(row):
-                    self.field_names[i] += "\n" + str(c.value)
+                    self.field_names[i] += "\n" + str(self.get_raw_value(c))
 
             seen_fields = set()
             for i, field in enumerate(self.field_names):
@@ -81,17 +128,61 @@ class WorkbookParser(TableParser):
                     self.field_names[i] = field
                 seen_fields.add(field)
 
-        self.data = list(map(self.parse_row, self.worksheet[self.start_row :]))
-
         self.extra_data = {}
         if self.header_row > 0:
             for r in range(0, self.header_row):
-                for c, cell in enumerate(self.worksheet[r]):
+                for c, cell in enumerate(head[r]):
                     val = self.get_value(cell)
                     if val is not None and val != "":
                         self.extra_data.setdefault(r, {})
                         self.extra_data[r][c] = val
 
+        yield from map(
+            self.get_row_parser(),
+            itertools.chain(head[self.start_row :], rows),
+        )
+
+    def get_sheet_options(self, name):
+        options = {"sheet_name": name}
+        if self.share_workbook:
+            options.update(loaded=True, workbook=self.workbook, lazy=True)
+            if getattr(self, "filename", None):
+                # Allows the sheet to be reloaded after unpickling
+                options["filename"] = self.filename
+        elif getattr(self, "filename", None):
+            # Each sheet will reopen the workbook when accessed
+            options.update(filename=self.filename, lazy=True)
+        else:
+            options.update(loaded=True, workbook=self.workbook)
+        return options
+
+    def __getstate__(self):
+        if self.workbook is not None and not self._owns_workbook:
+            # A shared workbook is not pickled, so unless the sheet can be
+            # reopened by filename it needs to be parsed first.
+            if not self.parsed and not getattr(self, "filename", None):
+                self.require_data()
+        return super(WorkbookParser, self).__getstate__()
+
+    @property
+    def share_workbook(self):
+        "Whether the workbook is still usable after the file is closed"
+        return True
+
+    def close_file(self):
+        # A shareable workbook stays loaded (e.g. for sheet_names), while one
+        # that reads from the file is closed along with it
+        if self.share_workbook or self.workbook is None:
+            pass
+        elif self._owns_workbook:
+            self.close_workbook()
+            self.workbook = None
+            self._owns_workbook = False
+        super(WorkbookParser, self).close_file()
+
+    def close_workbook(self):
+        pass
+
     def parse_workbook(self):
         raise NotImplementedError
 
@@ -108,39 +199,74 @@ class WorkbookParser(TableParser):
     def parse_row(self, row):
         return {
             name: self.get_value(row[i])
-            for i, name in enumerate(self.get_field_names())
+            for i, name in self.get_field_indices()
             if i < len(row)
         }
 
+    def get_field_indices(self):
+        "Returns the position and name of each field to load (see columns)"
+        names = self.get_all_field_names()
+        if self.columns is None:
+            return list(enumerate(names))
+        columns = set(self.project_fields(names))
+        return [(i, name) for i, name in enumerate(names) if name in columns]
+
+    def get_row_parser(self):
+        """
+        Returns a function equivalent to parse_row(), with the field names
+        resolved up front.
+        """
+        if type(self).parse_row is not WorkbookParser.parse_row:
+            return self.parse_row
+
+        convert_row = self.convert_row
+        if self.columns is None:
+            names = self.get_field_names()
+
+            def parse_row(row):
+                return dict(zip(names, convert_row(row)))
+
+            return parse_row
+
+        # Skip other cells before converting values
+        fields = self.get_field_indices()
+        indices = [i for i, name in fields]
+        names = [name for i, name in fields]
+
+        def parse_projected_row(row):
+            size = len(row)
+            cells = [row[i] for i in indices if i < size]
+            return dict(zip(names, convert_row(cells)))
+
+        return parse_projected_row
+
+    def convert_row(self, row):
+        "Convert a row of cells to a sequence of values"
+        return list(map(self.get_value, row))
+
     def get_value(self, cell):
         raise NotImplementedError
 
-    def dump(self, file=None):
+    def get_raw_value(self, cell):
+        raise NotImplementedError
+
+    def get_raw_values(self, row):
+        return list(map(self.get_raw_value, row))
+
+    def dump(self, file=None, data=None):
         if file is None:
             file = self.file
+        field_names, rows = self.get_dump_rows(data)
         write, close = self.open_worksheet(file)
-        for i, field in enumerate(self.field_names):
+        for i, field in enumerate(field_names):
             write(0, i, field)
-        for r, row in enumerate(self.data):
-            for c, field in enumerate(self.field_names):
+        for r, row in enumerate(rows):
+            for c, field in enumerate(field_names):
                 write(r + 1, c, row[field])
         close()
 
     def calc_width(self, val):
-        val = str(val) if val is not None else ""
-        size = 0
-        for c in val:
-            if c in ".,;:'\"iIlt1":
-                size += 0.5
-            elif c in "MW":
-                size += 1.3
-            elif c.isupper():
-                size += 1.2
-            elif c.islower():
-                size += 1
-            else:
-                size += 1.1
-        return size * 1.4
+        return text_width(val) * 1.4
 
 
 class OldExcelParser(WorkbookParser):
@@ -162,6 +288,9 @@ class OldExcelParser(WorkbookParser):
         worksheet = self.get_sheet_by_name(name)
         self.worksheet = [worksheet.row(i) for i in range(worksheet.nrows)]
 
+    def get_raw_value(self, cell):
+        return cell.value
+
     def get_value(self, cell):
         import xlrd
 
@@ -177,20 +306,7 @@ class OldExcelParser(WorkbookParser):
         return cell.value
 
     def calc_width(self, val):
-        val = str(val) if val is not None else ""
-        size = 0
-        for c in val:
-            if c in ".,;:'\"iIlt1":
-                size += 0.5
-            elif c in "MW":
-                size += 1.3
-            elif c.isupper():
-                size += 1.2
-            elif c.islower():
-                size += 1
-            else:
-                size += 1.1
-        return size
+        return text_width(val)
 
     def open_worksheet(self, file):
         import xlwt
@@ -235,10 +351,34 @@ class OldExcelParser(WorkbookParser):
 
 
 class ExcelParser(WorkbookParser):
+    # Open workbooks in openpyxl's read-only mode, which reads worksheets
+    # lazily rather than loading every cell up front
+    read_only = False
+
+    # Save workbooks in openpyxl's write-only mode, which streams rows to disk
+    # (column widths are then estimated from the first width_sample_size rows)
+    write_only = False
+    width_sample_size = 1000
+
     def parse_workbook(self):
         import openpyxl
 
-        self.workbook = openpyxl.open(self.file, data_only=True)
+        self.workbook = openpyxl.open(
+            self.file, read_only=self.read_only, data_only=True
+        )
+
+    def close_workbook(self):
+        self.workbook.close()
+
+    @property
+    def share_workbook(self):
+        # Read-only workbooks load worksheets from the file as needed
+        return not self.read_only
+
+    def get_sheet_options(self, name):
+        options = super(ExcelParser, self).get_sheet_options(name)
+        options["read_only"] = self.read_only
+        return options
 
     @property
     def sheet_names(self):
@@ -249,22 +389,48 @@ class ExcelParser(WorkbookParser):
 
     def parse_worksheet(self, name):
         worksheet = self.get_sheet_by_name(name)
-        self.worksheet = [row for row in worksheet.rows]
+        if not self.read_only:
+            self.worksheet = [row for row in worksheet.rows]
+        elif self.values_only:
+            # Skip creating cells, since get_value() only needs their values
+            self.worksheet = worksheet.iter_rows(values_only=True)
+        else:
+            self.worksheet = worksheet.iter_rows()
+
+    @property
+    def values_only(self):
+        "Whether worksheet rows contain plain values rather than cells"
+        return self.read_only and type(self).get_value is ExcelParser.get_value
+
+    def get_raw_value(self, cell):
+        if self.values_only:
+            return cell
+        return cell.value
+
+    def get_raw_values(self, row):
+        if self.values_only:
+            return row
+        return super(ExcelParser, self).get_raw_values(row)
+
+    def convert_row(self, row):
+        if not self.values_only:
+            return super(ExcelParser, self).convert_row(row)
+        # Only datetimes need to be converted (see get_value())
+        if datetime.datetime in set(map(type, row)):
+            return list(map(self.get_value, row))
+        return row
 
     def get_value(self, cell):
-        value = cell.internal_value
+        value = cell if self.values_only else cell.internal_value
         if isinstance(value, datetime.datetime):
             if value.time() == datetime.time(0, 0):
                 return value.date()
         return value
 
-    def open_worksheet(self, file):
-        from openpyxl import Workbook, styles, utils
-
-        workbook = Workbook()
-        worksheet = workbook.active
+    def get_formats(self):
+        from openpyxl import styles
 
-        formats = {
+        return {
             datetime.date: styles.NamedStyle(
                 name="date",
                 number_format=self.date_format,
@@ -283,6 +449,68 @@ class ExcelParser(WorkbookParser):
                 border=styles.Border(bottom=styles.Side(style="thick")),
             ),
         }
+
+    def dump(self, file=None, data=None):
+        if self.write_only:
+            self.dump_write_only(data)
+        else:
+            super(ExcelParser, self).dump(file, data)
+
+    def dump_write_only(self, data=None):
+        # Append whole rows to a write-only workbook, which streams them to
+        # disk instead of keeping every cell in memory.  Column widths need to
+        # be set before the first row, so they are estimated from a sample.
+        from openpyxl import Workbook, utils
+        from openpyxl.cell import WriteOnlyCell
+
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet()
+        formats = self.get_formats()
+
+        field_names, rows = self.get_dump_rows(data)
+        rows = iter(rows)
+        sample = list(itertools.islice(rows, self.width_sample_size))
+        for c, field in enumerate(field_names):
+            width = max(
+                map(self.calc_width, [field] + [row[field] for row in sample])
+            )
+            col = utils.get_column_letter(c + 1)
+            worksheet.column_dimensions[col].width = width
+
+        # Assigning a named style is slow, so reuse the resolved style arrays
+        style_arrays = {}
+
+        def styled_cell(val, fmt):
+            cell = WriteOnlyCell(worksheet, val)
+            if fmt.name in style_arrays:
+                cell._style = copy.copy(style_arrays[fmt.name])
+            else:
+                cell.style = fmt
+                style_arrays[fmt.name] = cell._style
+            return cell
+
+        def format_value(val):
+            fmt = formats.get(type(val))
+            if fmt:
+                return styled_cell(val, fmt)
+            return val
+
+        worksheet.append(
+            [styled_cell(field, formats["header"]) for field in field_names]
+        )
+        for row in itertools.chain(sample, rows):
+            values = [row[field] for field in field_names]
+            if not formats.keys().isdisjoint(map(type, values)):
+                values = list(map(format_value, values))
+            worksheet.append(values)
+        workbook.save(self.filename)
+
+    def open_worksheet(self, file):
+        from openpyxl import Workbook, utils
+
+        workbook = Workbook()
+        worksheet = workbook.active
+        formats = self.get_formats()
         widths = {}
 
         def write(r, c, val):
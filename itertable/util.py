@@ -138,6 +138,121 @@ def load_string(string, mapper=TupleMapper, options={}):
     return Iter(string=string, **options)
 
 
+def load_many(
+    sources,
+    mapper=TupleMapper,
+    options=None,
+    max_workers=8,
+    processes=None,
+    raise_errors=True,
+):
+    """
+    Load several sources concurrently, yielding (source, instance) pairs as
+    each one completes.  Each source can be a URL, a filename, or an
+    (Iter class, options) tuple.  Sources are loaded in a pool of max_workers
+    threads.  If processes is set, parsing is done in a separate pool of
+    worker processes.  If raise_errors is False, any exception raised while
+    loading a source is yielded in place of the instance.
+    """
+    from concurrent.futures import (
+        ThreadPoolExecutor,
+        ProcessPoolExecutor,
+        wait,
+        FIRST_COMPLETED,
+    )
+
+    threads = ThreadPoolExecutor(max_workers)
+    pool = ProcessPoolExecutor(processes) if processes else None
+    pending = {}
+    try:
+        for source in sources:
+            future = threads.submit(
+                _load_source, source, mapper, options, pool is None
+            )
+            pending[future] = (source, None)
+
+        while pending:
+            done, not_done = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                source, parsed_cls = pending.pop(future)
+                try:
+                    result = future.result()
+                    if parsed_cls is not None:
+                        # Restore instance from state parsed in worker
+                        cls = _get_iter_class(parsed_cls)
+                        state = result
+                        result = cls.__new__(cls)
+                        result.__dict__.update(state)
+                    elif pool is not None:
+                        future = pool.submit(_parse_source, *result)
+                        pending[future] = (source, result[0])
+                        continue
+                except Exception as e:
+                    if raise_errors:
+                        raise
+                    result = e
+                yield source, result
+    finally:
+        threads.shutdown(wait=False)
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+
+def _resolve_source(source, mapper, options):
+    if isinstance(source, tuple):
+        cls, source_options = source
+        return cls, dict(options or {}, **source_options)
+
+    if "://" in source:
+        loader, option = NetLoader, "url"
+    else:
+        loader, option = FileLoader, "filename"
+    mimetype = guess_type(source)
+    if mimetype not in PARSERS:
+        raise ParseFailed("Could not determine parser for %s" % mimetype)
+    # Leave class unmixed so it can be passed to worker processes
+    cls = (loader, PARSERS[mimetype], mapper)
+    return cls, dict(options or {}, **{option: source})
+
+
+def _get_iter_class(cls):
+    if isinstance(cls, tuple):
+        return make_iter(*cls)
+    return cls
+
+
+def _load_source(source, mapper, options, parse):
+    cls, options = _resolve_source(source, mapper, options)
+    if parse:
+        return _get_iter_class(cls)(**options)
+
+    # Load (but don't parse) the resource, and read it for the worker process
+    instance = _get_iter_class(cls)(**dict(options, stream=True))
+    if hasattr(instance, "file"):
+        content = instance.file.read()
+        instance.close_file()
+        options = dict(
+            options,
+            loaded=True,
+            empty_file=getattr(instance, "empty_file", None),
+        )
+    else:
+        content = None
+    return cls, options, content
+
+
+def _parse_source(cls, options, content):
+    cls = _get_iter_class(cls)
+    if content is not None:
+        if isinstance(content, bytes):
+            options["file"] = io.BytesIO(content)
+        else:
+            options["file"] = io.StringIO(content)
+    instance = cls(**options)
+    instance.require_data()
+    return instance.__getstate__()
+
+
 class FlatIter(TupleMapper, BaseIter):
     """
     Denormalizes a nested Iter structure (e.g. an array of individual time
@@ -1,5 +1,7 @@
 from os.path import join, dirname
 from os import unlink
+import tempfile
+import shutil
 import unittest
 
 
@@ -26,6 +28,27 @@ class IterTestCase(unittest.TestCase):
                 pass
         return filename
 
+    def get_temp_dir(self):
+        "Returns a temporary directory (removed after the test)"
+        if getattr(self, "_temp_dir", None) is None:
+            self._temp_dir = tempfile.mkdtemp()
+            self.addCleanup(shutil.rmtree, self._temp_dir)
+        return self._temp_dir
+
+    def get_temp_filename(self, name):
+        return join(self.get_temp_dir(), name)
+
+    def write_temp_file(self, name, content):
+        "Write a temporary file (as-is, without newline translation)"
+        filename = self.get_temp_filename(name)
+        if isinstance(content, bytes):
+            with open(filename, "wb") as f:
+                f.write(content)
+        else:
+            with open(filename, "w", newline="") as f:
+                f.write(content)
+        return filename
+
     def check_instance(self, instance):
         self.assertEqual(len(instance), len(self.data))
 
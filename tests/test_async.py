@@ -0,0 +1,130 @@
+from itertable import (
+    make_iter,
+    AsyncNetLoader,
+    CsvParser,
+    CsvFileIter,
+)
+from itertable.exceptions import LoadFailed
+from .base import IterTestCase
+import asyncio
+import httpretty
+import unittest
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class Response:
+    def __init__(self, status_code, text):
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode("utf-8")
+
+
+class Client:
+    "Minimal stand-in for httpx.AsyncClient"
+
+    def __init__(self):
+        self.requests = []
+
+    async def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs))
+        await asyncio.sleep(0)
+        if url == "http://example.com/test.csv":
+            return Response(200, "one,two,three\n1,2,3\n4,5,6")
+        return Response(404, "Not Found")
+
+
+class AsyncCsvIter(make_iter(AsyncNetLoader, CsvParser)):
+    url = "http://example.com/test.csv"
+
+
+class AsyncTestCase(IterTestCase):
+    def test_aload(self):
+        client = Client()
+        instance = asyncio.run(AsyncCsvIter.aload(async_client=client))
+        self.check_instance(instance)
+        self.assertEqual(len(client.requests), 1)
+        method, url, options = client.requests[0]
+        self.assertEqual(method, "GET")
+        self.assertIn("User-Agent", options["headers"])
+
+    def test_aload_fail(self):
+        with self.assertRaises(LoadFailed) as cm:
+            asyncio.run(
+                AsyncCsvIter.aload(
+                    async_client=Client(),
+                    url="http://example.com/fail.txt",
+                )
+            )
+        self.assertEqual(cm.exception.code, 404)
+
+    def test_aload_default(self):
+        # Non-async loaders are run in a worker thread
+        filename = self.get_filename("test", "csv")
+        instance = asyncio.run(CsvFileIter.aload(filename=filename))
+        self.check_instance(instance)
+
+    def test_async_iter(self):
+        async def load():
+            instance = await AsyncCsvIter.aload(
+                async_client=Client(), stream=True
+            )
+            self.assertFalse(instance.parsed)
+            return [row async for row in instance], instance
+
+        rows, instance = asyncio.run(load())
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1].three, "6")
+        self.assertFalse(instance.parsed)
+
+    def test_async_iter_batches(self):
+        async def load():
+            instance = await CsvFileIter.aload(
+                filename=self.get_filename("test", "csv"),
+                stream=True,
+                async_batch_size=1,
+            )
+            return [row async for row in instance]
+
+        rows = asyncio.run(load())
+        self.assertEqual([row.one for row in rows], ["1", "4"])
+
+    def test_sync_fallback(self):
+        # Synchronous loads use the regular (non-async) client
+        httpretty.enable()
+        self.addCleanup(httpretty.reset)
+        self.addCleanup(httpretty.disable)
+        httpretty.register_uri(
+            httpretty.GET,
+            "http://example.com/test.csv",
+            body="one,two,three\n1,2,3\n4,5,6",
+        )
+
+        async def load():
+            instance = await AsyncCsvIter.aload(
+                async_client=Client(), stream=True
+            )
+            return [row async for row in instance], instance
+
+        rows, instance = asyncio.run(load())
+        self.assertEqual(len(rows), 2)
+        self.check_instance(instance)
+
+    @unittest.skipUnless(httpx, "httpx is not installed")
+    def test_shared_async_client(self):
+        async def get_clients():
+            return (
+                AsyncCsvIter(lazy=True).get_async_client(),
+                AsyncCsvIter(lazy=True).get_async_client(),
+            )
+
+        client1, client2 = asyncio.run(get_clients())
+        self.assertIs(client1, client2)
+        self.assertIsInstance(client1, httpx.AsyncClient)
+        self.assertTrue(client1.is_closed)
+        other, _ = asyncio.run(get_clients())
+        self.assertIsNot(other, client1)
+        self.assertTrue(other.is_closed)
@@ -0,0 +1,136 @@
+from itertable import (
+    load_file,
+    CsvFileIter,
+    CsvStringIter,
+    JsonFileIter,
+    JsonStringIter,
+    XmlFileIter,
+    ExcelFileIter,
+    OldExcelFileIter,
+)
+from itertable.exceptions import ReadOnly
+from .base import IterTestCase
+from io import StringIO
+
+
+class ColumnsTestCase(IterTestCase):
+    def check_columns(self, instance):
+        rows = [row for row in instance]
+        self.assertEqual(rows[0]._fields, ("one", "three"))
+        self.assertEqual(
+            [(int(row.one), int(row.three)) for row in rows],
+            [(1, 3), (4, 6)],
+        )
+        self.assertEqual(instance.get_field_names(), ["one", "three"])
+
+    def test_load_file(self):
+        for ext in ("csv", "json", "xml", "xls", "xlsx"):
+            filename = self.get_filename("test", ext)
+            options = {"columns": ["one", "three"]}
+            instance = load_file(filename, options=options)
+            self.check_columns(instance)
+            self.assertEqual(set(instance.data[0]), {"one", "three"})
+
+    def test_stream(self):
+        classes = CsvFileIter, JsonFileIter, XmlFileIter
+        for ext, cls in zip(("csv", "json", "xml"), classes):
+            instance = cls(
+                filename=self.get_filename("test", ext),
+                columns=["three", "one"],
+                stream=True,
+            )
+            self.check_columns(instance)
+
+        for ext, cls in ("xls", OldExcelFileIter), ("xlsx", ExcelFileIter):
+            instance = cls(
+                filename=self.get_filename("test", ext),
+                columns=["one", "three"],
+                stream=True,
+                read_only=True,
+            )
+            self.check_columns(instance)
+
+    def test_csv_field_names(self):
+        instance = CsvStringIter(
+            string="1,2,3\n4,5,6,7\n8",
+            field_names=["one", "two", "three"],
+            columns=["one", "three"],
+        )
+        self.assertEqual(
+            instance.data,
+            [
+                {"one": "1", "three": "3"},
+                {"one": "4", "three": "6"},
+                {"one": "8", "three": None},
+            ],
+        )
+        self.assertEqual(instance.field_names, ["one", "two", "three"])
+
+    def test_csv_columns(self):
+        instance = CsvFileIter(
+            filename=self.get_filename("test", "csv"),
+            columns=["two"],
+            stream=True,
+        )
+        self.assertEqual(instance.as_dataframe().columns.tolist(), ["two"])
+
+    def test_json_namespace(self):
+        instance = JsonStringIter(
+            string='{"items": [{"one": 1, "two": 2}, [3]]}',
+            namespace="items",
+            columns=["two"],
+        )
+        self.assertEqual(instance.data, [{"two": 2}, [3]])
+
+
+class CsvColumnsTestCase(IterTestCase):
+    def setUp(self):
+        rows = ["%s,%s,%s\n" % (i, i * 2, i * 3) for i in range(200)]
+        self.filename = self.write_temp_file(
+            "test.csv", "one,two,three\n" + "".join(rows)
+        )
+
+    def check_data(self, instance):
+        self.assertEqual(len(instance.data), 200)
+        self.assertEqual(instance.data[10], {"one": "10", "three": "30"})
+        self.assertEqual(instance[199].three, "597")
+
+    def test_offset_index(self):
+        instance = CsvFileIter(
+            filename=self.filename,
+            columns=["one", "three"],
+            offset_index=True,
+        )
+        self.check_data(instance)
+
+    def test_parallel(self):
+        instance = CsvFileIter(
+            filename=self.filename,
+            columns=["one", "three"],
+            parse_processes=2,
+            parallel_min_size=0,
+        )
+        self.check_data(instance)
+
+    def test_read_only(self):
+        filename = self.write_temp_file(
+            "test.csv", "one,two,three\n1,2,3\n4,5,6\n"
+        )
+        instance = CsvFileIter(filename=filename, columns=["one"])
+        with self.assertRaises(ReadOnly):
+            instance.append(instance.create(one="9"))
+        with self.assertRaises(ReadOnly):
+            instance[0] = instance.create(one="9")
+        with self.assertRaises(ReadOnly):
+            del instance[0]
+        with self.assertRaises(ReadOnly):
+            instance.save()
+        with self.assertRaises(ReadOnly):
+            instance.dump(StringIO())
+        with open(filename) as f:
+            self.assertEqual(f.read(), "one,two,three\n1,2,3\n4,5,6\n")
+
+        # Projected data can still be written elsewhere explicitly
+        output = StringIO()
+        instance.dump(output, data=instance.data)
+        self.assertEqual(output.getvalue().splitlines(), ["one", "1", "4"])
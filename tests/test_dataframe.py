@@ -1,5 +1,18 @@
-from itertable import load_string, BaseIter
+from itertable import (
+    load_string,
+    make_iter,
+    BaseIter,
+    CsvStringIter,
+    StringLoader,
+    CsvParser,
+    TimeSeriesMapper,
+)
 from .base import IterTestCase
+from datetime import datetime
+
+
+class TimeSeriesIter(make_iter(StringLoader, CsvParser, TimeSeriesMapper)):
+    date_formats = ["%Y-%m-%d"]
 
 
 class LoadFileTestCase(IterTestCase):
@@ -32,3 +45,57 @@ class LoadFileTestCase(IterTestCase):
 
         val = df[df.two == "2"].three[0]
         self.assertEqual(val, "3")
+
+    def test_csv_stream_dataframe(self):
+        io = CsvStringIter(
+            string=self.csv_data + "\n\n7,8", stream=True, column_chunk_size=1
+        )
+        df = io.as_dataframe()
+        self.assertFalse(io.parsed)
+        self.assertEqual(list(df.columns), ["one", "two", "three"])
+        self.assertEqual(list(df.three[:2]), ["3", "6"])
+        self.assertTrue(df.three.isna()[2])
+
+    def test_time_series_dataframe(self):
+        io = TimeSeriesIter(
+            string="date,value,note\n"
+            "2014-01-01,1,a\n"
+            "2014-01-02, 2.5,\n"
+            "2014-01-03,,c\n"
+        )
+        df = io.as_dataframe()
+        self.assertEqual(str(df.date.dtype)[:10], "datetime64")
+        self.assertEqual(df.date[1], datetime(2014, 1, 2))
+        self.assertEqual(list(df.value), [1.0, 2.5, ""])
+        self.assertEqual(list(df.note), ["a", "", "c"])
+
+        # Same result as row-wise conversion
+        io.columnar = False
+        self.assertEqual(io.as_dataframe().to_dict(), df.to_dict())
+
+    def test_time_series_map_functions_dataframe(self):
+        io = TimeSeriesIter(
+            string="date,value\n2014-01-01,1\n2014-01-02,2\n",
+            map_functions=[int],
+        )
+        df = io.as_dataframe()
+        self.assertEqual(list(df.value), [1, 2])
+        self.assertEqual(str(df.value.dtype), "int64")
+        self.assertEqual(list(df.date), ["2014-01-01", "2014-01-02"])
+
+        # Same result as row-wise conversion
+        io.columnar = False
+        self.assertEqual(io.as_dataframe().to_dict(), df.to_dict())
+
+    def test_custom_usable_item_dataframe(self):
+        class TenIter(CsvStringIter):
+            def usable_item(self, item):
+                uitem = super().usable_item(item)
+                return uitem._replace(one=int(uitem.one) * 10)
+
+        io = TenIter(string=self.csv_data)
+        self.assertFalse(io.use_columnar)
+        self.assertEqual([row.one for row in io], [10, 40])
+        self.assertEqual(list(io.as_dataframe().one), [10, 40])
+
+        self.assertTrue(CsvStringIter(string=self.csv_data).use_columnar)
@@ -0,0 +1,216 @@
+from itertable import (
+    make_iter,
+    StringLoader,
+    ExcelParser,
+    ExcelFileIter,
+    OldExcelFileIter,
+)
+from .base import IterTestCase
+from datetime import date, datetime
+import pickle
+
+
+class ExcelStringIter(make_iter(StringLoader, ExcelParser)):
+    pass
+
+
+class UpperExcelFileIter(ExcelFileIter):
+    def parse_row(self, row):
+        row = super().parse_row(row)
+        return {key.upper(): value for key, value in row.items()}
+
+
+class FormatExcelFileIter(ExcelFileIter):
+    def get_value(self, cell):
+        return cell.number_format
+
+
+class ExcelTestCase(IterTestCase):
+    def test_workbook(self):
+        filename = self.get_filename("test", "xlsx")
+        instance = ExcelFileIter(filename=filename)
+        self.check_instance(instance)
+        self.assertIsNotNone(instance.workbook)
+        self.assertEqual(instance.sheet_names, ["Sheet1"])
+
+    def test_get_value_cell(self):
+        filename = self.get_filename("test", "xlsx")
+        for read_only in False, True:
+            instance = FormatExcelFileIter(
+                filename=filename, read_only=read_only
+            )
+            self.assertEqual(instance.data[0]["one"], "GENERAL")
+
+    def test_read_only(self):
+        filename = self.get_filename("test", "xlsx")
+        instance = ExcelFileIter(filename=filename, read_only=True)
+        self.check_instance(instance)
+        self.assertIsNone(instance.workbook)
+        self.assertTrue(instance.file.closed)
+
+    def test_read_only_extra_data(self):
+        filename = self.get_filename("extra", "xlsx")
+        expected = ExcelFileIter(filename=filename, start_row=5)
+        instance = ExcelFileIter(
+            filename=filename, start_row=5, read_only=True
+        )
+        self.assertEqual(instance.field_names, expected.field_names)
+        self.assertEqual(instance.extra_data, expected.extra_data)
+        self.assertEqual(instance.data, expected.data)
+
+    def test_read_only_sheets(self):
+        filename = self.get_filename("test", "xlsx")
+        instance = ExcelFileIter(
+            filename=filename, read_only=True, sheet_name=None
+        )
+        self.assertEqual(len(instance), 1)
+        self.check_instance(instance[0].data)
+
+    def test_parse_row(self):
+        filename = self.get_filename("test", "xlsx")
+        instance = UpperExcelFileIter(filename=filename)
+        self.assertEqual(instance.data[0], {"ONE": 1, "TWO": 2, "THREE": 3})
+
+    def test_dates(self):
+        from openpyxl import Workbook
+
+        filename = self.get_temp_filename("dates.xlsx")
+        workbook = Workbook()
+        workbook.active.append(["date", "value", "extra"])
+        workbook.active.append([datetime(2024, 1, 2), 1])
+        workbook.active.append([datetime(2024, 1, 2, 3, 4), 2, "x"])
+        workbook.save(filename)
+
+        instance = ExcelFileIter(filename=filename)
+        self.assertEqual(
+            instance.data,
+            [
+                {"date": date(2024, 1, 2), "value": 1, "extra": None},
+                {"date": datetime(2024, 1, 2, 3, 4), "value": 2, "extra": "x"},
+            ],
+        )
+
+    def test_write_only(self):
+        from openpyxl import load_workbook
+
+        filename = self.get_temp_filename("output.xlsx")
+        data = [
+            {"date": date(2024, 1, 2), "value": 1, "name": "short"},
+            {"date": date(2024, 1, 3), "value": 2, "name": "Much Longer"},
+        ]
+        instance = ExcelFileIter(
+            filename=filename,
+            require_existing=False,
+            write_only=True,
+            width_sample_size=1,
+        )
+        instance.dump(data=iter(data))
+
+        self.assertEqual(ExcelFileIter(filename=filename).data, data)
+        workbook = load_workbook(filename)
+        worksheet = workbook.active
+        self.assertTrue(worksheet["A1"].font.bold)
+        self.assertEqual(worksheet["A2"].number_format, instance.date_format)
+        # Widths only reflect the sampled rows
+        self.assertEqual(
+            worksheet.column_dimensions["C"].width,
+            instance.calc_width("short"),
+        )
+        workbook.close()
+
+    def test_calc_width(self):
+        instance = ExcelFileIter(lazy=True)
+        self.assertAlmostEqual(instance.calc_width("Wi1a"), 3.3 * 1.4)
+        self.assertAlmostEqual(instance.calc_width("é"), 1.4)
+        self.assertEqual(instance.calc_width(None), 0)
+
+    def test_stream(self):
+        for cls, ext in (ExcelFileIter, "xlsx"), (OldExcelFileIter, "xls"):
+            filename = self.get_filename("test", ext)
+            instance = cls(filename=filename, stream=True, read_only=True)
+            self.assertFalse(instance.parsed)
+            rows = [row for row in instance]
+            self.assertEqual(len(rows), 2)
+            self.assertEqual(rows[1].three, 6)
+            self.assertTrue(instance.file.closed)
+            if cls is ExcelFileIter:
+                self.assertIsNone(instance.workbook)
+            self.assertEqual([row for row in instance], rows)
+            self.check_instance(instance)
+
+
+class ExcelSheetsTestCase(IterTestCase):
+    def setUp(self):
+        from openpyxl import Workbook
+
+        self.filename = self.get_temp_filename("sheets.xlsx")
+        workbook = Workbook()
+        workbook.remove(workbook.active)
+        for i in range(3):
+            worksheet = workbook.create_sheet("Sheet%s" % i)
+            worksheet.append(["one", "two", "three"])
+            for row in self.data:
+                worksheet.append([row["one"] * i, row["two"], row["three"]])
+        workbook.save(self.filename)
+
+    def check_sheets(self, instance):
+        self.assertEqual(
+            [row.name for row in instance], ["Sheet0", "Sheet1", "Sheet2"]
+        )
+        self.check_instance(instance[1].data)
+        self.assertEqual(instance[2].data[1].one, 8)
+
+    def test_lazy_sheets(self):
+        instance = ExcelFileIter(filename=self.filename, sheet_name=None)
+        sheets = [row.data for row in instance]
+        self.assertFalse(any(sheet.parsed for sheet in sheets))
+        self.assertEqual(sheets[1][0].two, 2)
+        self.assertEqual(
+            [sheet.parsed for sheet in sheets], [False, True, False]
+        )
+        self.check_sheets(instance)
+
+    def test_lazy_sheets_read_only(self):
+        instance = ExcelFileIter(
+            filename=self.filename, sheet_name=None, read_only=True
+        )
+        self.assertIsNone(instance.workbook)
+        sheet = instance[1].data
+        self.assertFalse(sheet.loaded)
+        self.assertTrue(sheet.read_only)
+        self.check_sheets(instance)
+        self.assertTrue(sheet.file.closed)
+        self.assertIsNone(sheet.workbook)
+
+    def test_sheets_workers(self):
+        for read_only in False, True:
+            instance = ExcelFileIter(
+                filename=self.filename,
+                sheet_name=None,
+                read_only=read_only,
+                max_workers=3,
+            )
+            self.assertTrue(all(row.data.parsed for row in instance))
+            self.check_sheets(instance)
+
+    def test_lazy_sheets_pickle(self):
+        for read_only in False, True:
+            instance = ExcelFileIter(
+                filename=self.filename, sheet_name=None, read_only=read_only
+            )
+            instance = pickle.loads(pickle.dumps(instance))
+            self.check_sheets(instance)
+
+    def test_lazy_sheets_string_pickle(self):
+        with open(self.filename, "rb") as f:
+            instance = ExcelStringIter(string=f.read(), sheet_name=None)
+        instance = pickle.loads(pickle.dumps(instance))
+        self.check_sheets(instance)
+
+    def test_lazy_sheets_parse_cache(self):
+        cache_dir = self.get_temp_filename("cache")
+        for i in range(2):
+            instance = ExcelFileIter(
+                filename=self.filename, sheet_name=None, parse_cache=cache_dir
+            )
+            self.check_sheets(instance)
@@ -21,6 +21,16 @@ class GisTestCase(IterTestCase):
             instance = ShapeIter(filename=filename)
             self.check_instance(instance)
 
+    def test_shapeio_columns(self):
+        for ext in self.types:
+            filename = self.get_filename("test", ext)
+            instance = ShapeIter(filename=filename, columns=["id", "two"])
+            self.assertEqual(instance.get_field_names(), ["id", "two"])
+            rows = list(instance.values())
+            self.assertEqual(rows[0]._fields, ("id", "two"))
+            self.assertEqual([int(row.two) for row in rows], [2, 5])
+            self.assertNotIn("geometry", instance.data[0])
+
     def test_shapeio_sync(self):
         for source_ext in self.types:
             for dest_ext in self.types:
@@ -0,0 +1,82 @@
+from itertable import BaseIter, CsvStringIter
+from .base import IterTestCase
+
+
+class KeyIter(BaseIter):
+    key_field = "one"
+
+
+class KeyCsvIter(CsvStringIter):
+    key_field = "one"
+
+
+class IndexTestCase(IterTestCase):
+    def assert_index(self, instance):
+        index = dict(instance.compute_index())
+        self.assertEqual(index, instance.compute_index(True))
+
+    def test_append(self):
+        instance = KeyIter(data=[])
+        for i in range(5):
+            instance[i] = {"one": i, "two": i * 2}
+            self.assert_index(instance)
+        self.assertEqual(instance.compute_index(), {i: i for i in range(5)})
+        self.assertEqual(instance[3]["two"], 6)
+
+    def test_insert(self):
+        instance = KeyIter(data=[{"one": 1}, {"one": 2}])
+        instance.compute_index()
+        instance.insert(0, {"one": 0})
+        self.assert_index(instance)
+        instance.insert(-1, {"one": 1.5})
+        self.assert_index(instance)
+        instance.insert(100, {"one": 3})
+        self.assert_index(instance)
+        instance.append({"one": 4})
+        self.assert_index(instance)
+        self.assertEqual(
+            [row["one"] for row in instance.data], [0, 1, 1.5, 2, 3, 4]
+        )
+
+    def test_insert_duplicate(self):
+        instance = KeyIter(data=[{"one": 1}, {"one": 2, "two": "last"}])
+        instance.compute_index()
+        instance.insert(0, {"one": 2, "two": "first"})
+        self.assert_index(instance)
+        self.assertEqual(instance[2]["two"], "last")
+
+    def test_delete(self):
+        instance = KeyIter(data=[{"one": i} for i in range(5)])
+        instance.compute_index()
+        del instance[2]
+        self.assert_index(instance)
+        del instance[0]
+        self.assert_index(instance)
+        del instance[4]
+        self.assert_index(instance)
+        self.assertEqual(instance.compute_index(), {1: 0, 3: 1})
+
+    def test_delete_duplicate(self):
+        instance = KeyIter(data=[{"one": 1}, {"one": 2}, {"one": 1}])
+        instance.compute_index()
+        del instance[1]
+        self.assert_index(instance)
+        self.assertEqual(instance.compute_index(), {1: 0, 2: 1})
+        self.assertEqual(instance[1], {"one": 1})
+
+    def test_sync(self):
+        source = KeyCsvIter(string="one,two,three\n1,2,3\n4,5,6")
+        dest = KeyCsvIter(string="", field_names=["one", "two", "three"])
+        source.sync(dest)
+        self.assert_index(dest)
+        self.assertEqual(list(dest), ["1", "4"])
+        self.assertEqual(dest["4"].three, "6")
+
+    def test_copy(self):
+        source = KeyCsvIter(string="one,two,three\n1,2,3\n4,5,6")
+        dest = KeyCsvIter(string="one,two,three\n7,8,9")
+        dest.compute_index()
+        source.copy(dest)
+        self.assert_index(dest)
+        self.assertEqual(list(dest), ["1", "4"])
+        self.assertEqual(dest["4"].three, "6")
@@ -0,0 +1,69 @@
+from itertable import JsonFileIter, JsonStringIter
+from itertable.parsers.readers import JsonItemReader
+from itertable.exceptions import ParseFailed
+from .base import IterTestCase
+import io
+
+
+class JsonTestCase(IterTestCase):
+    def test_item_reader(self):
+        content = ' [1, 2.5e3 ,{"a": [1, 2]}, "x\\"y", true, null, 12345]'
+        expected = [1, 2500.0, {"a": [1, 2]}, 'x"y', True, None, 12345]
+        for chunk_size in 1, 2, 3, 5, 100:
+            reader = JsonItemReader(io.StringIO(content))
+            reader.chunk_size = chunk_size
+            self.assertEqual(list(reader), expected)
+
+    def test_item_reader_path(self):
+        content = '{"a": {"b": [1, {"c": []}]}, "c": {"d": [1, 2]}}'
+        reader = JsonItemReader(io.StringIO(content), ["c", "d"])
+        self.assertEqual(list(reader), [1, 2])
+        reader = JsonItemReader(io.StringIO(content), ["c", "e"])
+        with self.assertRaises(KeyError):
+            list(reader)
+
+    def test_stream(self):
+        filename = self.get_filename("test", "json")
+        instance = JsonFileIter(filename=filename, stream=True)
+        rows = [row for row in instance]
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1].three, 6)
+        self.assertFalse(hasattr(instance, "data"))
+        self.assertTrue(instance.file.closed)
+        self.check_instance(instance)
+
+    def test_stream_namespace(self):
+        filename = self.get_filename("custom", "json")
+        instance = JsonFileIter(
+            filename=filename, namespace="data.items", stream=True
+        )
+        self.assertEqual([row.one for row in instance], [1, 4])
+        self.check_instance(instance)
+
+    def test_stream_invalid(self):
+        instance = JsonStringIter(string='[{"one": 1}, {"one"', stream=True)
+        with self.assertRaises(ParseFailed):
+            [row for row in instance]
+
+    def test_json_lines(self):
+        string = '{"one": 1, "two": 2, "three": 3}\n\n' + (
+            '{"one": 4, "two": 5, "three": 6}\n'
+        )
+        for stream in False, True:
+            instance = JsonStringIter(
+                string=string, json_lines=True, stream=stream
+            )
+            self.check_instance(instance)
+
+        filename = self.get_temp_filename("output.jsonl")
+        instance = JsonFileIter(
+            filename=filename,
+            json_lines=True,
+            require_existing=False,
+            field_names=["one", "two", "three"],
+        )
+        for row in self.data:
+            instance.append(instance.create(**row))
+        instance.save()
+        with open(filename) as f:
+            self.assertEqual(f.read(), string.replace("\n\n", "\n"))
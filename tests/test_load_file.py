@@ -1,4 +1,5 @@
 from itertable import load_file
+from itertable.loaders import MemoryMapIO
 from itertable.exceptions import LoadFailed, NoData
 from .base import IterTestCase
 import unittest
@@ -21,6 +22,20 @@ class LoadFileTestCase(IterTestCase):
             instance = load_file(filename)
             self.check_instance(instance)
 
+    def test_load_file_memory_map(self):
+        for ext in self.types:
+            filename = self.get_filename("test", ext)
+            instance = load_file(filename, options={"memory_map": True})
+            self.check_instance(instance)
+
+        filename = self.get_filename("test2", "csv")
+        instance = load_file(
+            filename, options={"memory_map": True, "stream": True}
+        )
+        self.assertIsInstance(instance.file.buffer, MemoryMapIO)
+        self.check_instance(instance)
+        self.assertTrue(instance.file.closed)
+
     def test_load_file_object(self):
         for ext in self.types:
             filename = self.get_filename("test", ext)
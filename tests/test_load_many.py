@@ -0,0 +1,59 @@
+from itertable import load_many, CsvFileIter, CsvNetIter
+from itertable.exceptions import LoadFailed
+from .base import IterTestCase
+import httpretty
+
+
+class LoadManyTestCase(IterTestCase):
+    def setUp(self):
+        self.types = ("csv", "json", "xml", "xls", "xlsx")
+        httpretty.enable()
+        httpretty.register_uri(
+            httpretty.GET,
+            "http://example.com/test.csv",
+            body="one,two,three\n1,2,3\n4,5,6",
+            content_type="text/csv",
+        )
+
+    def tearDown(self):
+        httpretty.disable()
+        httpretty.reset()
+
+    def get_sources(self):
+        sources = [self.get_filename("test", ext) for ext in self.types]
+        sources.append("http://example.com/test.csv")
+        sources.append(
+            (CsvFileIter, {"filename": self.get_filename("test2", "csv")})
+        )
+        sources.append((CsvNetIter, {"url": "http://example.com/test.csv"}))
+        return sources
+
+    def check_results(self, sources, results):
+        self.assertEqual(len(results), len(sources))
+        for source, instance in results:
+            self.assertIn(source, sources)
+            self.check_instance(instance)
+            if source is sources[-1]:
+                self.assertIsInstance(instance, CsvNetIter)
+
+    def test_load_many(self):
+        sources = self.get_sources()
+        results = list(load_many(sources, max_workers=3))
+        self.check_results(sources, results)
+
+    def test_load_many_processes(self):
+        sources = self.get_sources()
+        results = list(load_many(sources, max_workers=3, processes=2))
+        self.check_results(sources, results)
+
+    def test_load_many_errors(self):
+        sources = [
+            self.get_filename("test", "csv"),
+            self.get_filename("nonexisting", "csv"),
+        ]
+        with self.assertRaises(LoadFailed):
+            list(load_many(sources))
+
+        results = dict(load_many(sources, raise_errors=False))
+        self.check_instance(results[sources[0]])
+        self.assertIsInstance(results[sources[1]], LoadFailed)
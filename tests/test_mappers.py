@@ -0,0 +1,136 @@
+from itertable import (
+    CsvStringIter,
+    JsonStringIter,
+    DictMapper,
+    TimeSeriesMapper,
+    make_iter,
+    StringLoader,
+    CsvParser,
+)
+from datetime import datetime
+from itertable.exceptions import MappingFailed
+from .base import IterTestCase
+
+
+class UpperIter(CsvStringIter):
+    def map_value(self, field, value):
+        return value.upper()
+
+
+class RenameIter(CsvStringIter):
+    def map_field(self, field):
+        if field == "one":
+            return "two"
+        return super().map_field(field)
+
+
+class TimeSeriesIter(make_iter(StringLoader, CsvParser, TimeSeriesMapper)):
+    date_formats = ["%Y-%m-%d", "%d/%m/%Y"]
+    key_fields = ["date"]
+
+
+class MapperTestCase(IterTestCase):
+    csv_data = "one,two,three\n1,2,3\n4,5,6"
+
+    def test_item_converter(self):
+        instance = CsvStringIter(string=self.csv_data)
+        self.assertIsNotNone(instance.item_converter)
+        self.check_instance(instance)
+        self.assertIsInstance(instance[0], instance.tuple_class)
+
+    def test_item_converter_map_value(self):
+        instance = UpperIter(string="one,two\na,b")
+        self.assertEqual(instance[0], ("A", "B"))
+
+    def test_item_converter_map_field(self):
+        instance = RenameIter(string=self.csv_data)
+        self.assertIsNone(instance.item_converter)
+        self.assertEqual(instance[0], (None, "2", "3"))
+
+    def test_item_converter_unexpected_field(self):
+        instance = JsonStringIter(string='[{"one": 1}, {"one": 2, "two": 3}]')
+        self.assertEqual(instance[0].one, 1)
+        with self.assertRaises(MappingFailed):
+            instance[1]
+
+    def test_item_converter_missing_field(self):
+        instance = JsonStringIter(
+            string='[{"one": 1, "two": 2}, {"one": 3}]',
+            field_names=["one", "two"],
+        )
+        self.assertEqual(instance[1].one, 3)
+        self.assertIsNone(instance[1].two)
+
+    def test_inverse_maps(self):
+        mapper = DictMapper()
+        mapper.field_map = {"One": "one", "Uno": "one", "Two": "two"}
+        mapper.value_map = {"Y": True, "yes": "y", "si": "y"}
+        self.assertEqual(mapper.unmap_field("one"), "One")
+        self.assertEqual(mapper.unmap_field("two"), "Two")
+        self.assertEqual(mapper.unmap_field("three"), "three")
+        self.assertEqual(mapper.unmap_value("one", "y"), "yes")
+        self.assertEqual(mapper.unmap_value("one", "n"), "n")
+        self.assertEqual(mapper.unmap_value("one", True), True)
+
+        # Cache is invalidated when maps are replaced...
+        mapper.field_map["Three"] = "three"
+        self.assertEqual(mapper.unmap_field("three"), "Three")
+        mapper.value_map = {"no": "n"}
+        self.assertEqual(mapper.unmap_value("one", "n"), "no")
+        self.assertEqual(mapper.unmap_value("one", "y"), "y")
+
+        # ... or modified in place
+        mapper.value_map["no"] = "x"
+        self.assertEqual(mapper.unmap_value("one", "x"), "no")
+        self.assertEqual(mapper.unmap_value("one", "n"), "n")
+
+    def test_inverse_maps_per_item(self):
+        # Inverse maps are checked once per item, not once per value, so
+        # unmapping cost grows linearly with the number of fields
+        class CountMapper(DictMapper):
+            checks = 0
+
+            def get_inverse_map(self, name):
+                self.checks += 1
+                return super().get_inverse_map(name)
+
+        for width in 10, 100:
+            mapper = CountMapper()
+            mapper.field_map = {"F%s" % i: "f%s" % i for i in range(width)}
+            mapper.value_map = {"yes": "y"}
+            item = mapper.parse_usable_item(
+                {"f%s" % i: "y" for i in range(width)}
+            )
+            self.assertEqual(item["F1"], "yes")
+            self.assertEqual(mapper.checks, 2)
+
+    def test_parse_usable_item(self):
+        instance = CsvStringIter(string="One Field,Two Field\n1,2")
+        item = instance.parse_usable_item(instance[0])
+        self.assertEqual(item, {"One Field": "1", "Two Field": "2"})
+
+    def test_time_series(self):
+        instance = TimeSeriesIter(
+            string="date,value\n2014-01-01,1\n02/01/2014,x\n2014-01-03, 3\n"
+        )
+        self.assertEqual(
+            [tuple(row) for row in instance],
+            [
+                (datetime(2014, 1, 1), 1.0),
+                (datetime(2014, 1, 2), "x"),
+                (datetime(2014, 1, 3), 3.0),
+            ],
+        )
+        self.assertEqual(
+            instance._field_types, {"date": [1, 1], "value": [0, 2]}
+        )
+
+    def test_time_series_lock(self):
+        instance = TimeSeriesIter(
+            string="date,value\n2014-01-01,1\n2014-01-02,2\n02/01/2014,3\n",
+            lock_types_after=2,
+        )
+        rows = [row for row in instance]
+        self.assertEqual(rows[1].date, datetime(2014, 1, 2))
+        self.assertEqual(rows[2].date, "02/01/2014")
+        self.assertEqual(rows[2].value, 3.0)
@@ -1,5 +1,9 @@
 import httpretty
-from itertable import CsvNetIter, load_url
+import requests
+import tempfile
+import shutil
+import os
+from itertable import CsvNetIter, JsonNetIter, load_url
 from itertable.exceptions import LoadFailed
 import pickle
 from .base import IterTestCase
@@ -19,6 +23,13 @@ class NetLoaderTestCase(IterTestCase):
             body="one,two,three\n1,2,3\n4,5,6",
             content_type="text/csv",
         )
+        httpretty.register_uri(
+            httpretty.GET,
+            "http://example.com/test.json",
+            body='[{"one": 1, "two": 2, "three": 3}, '
+            '{"one": 4, "two": 5, "three": 6}]',
+            content_type="application/json",
+        )
         httpretty.register_uri(
             httpretty.GET,
             "http://example.com/fail.txt",
@@ -84,6 +95,96 @@ class NetLoaderTestCase(IterTestCase):
         instance = pickle.loads(pickle.dumps(instance))
         self.check_instance(instance)
 
+    def test_load_csv_stream(self):
+        instance = TestIter(stream=True)
+        self.assertFalse(instance.parsed)
+        self.assertFalse(instance.file.closed)
+        rows = [row for row in instance]
+        self.assertTrue(instance.file.closed)
+        self.assertEqual(rows[1].three, "6")
+        self.check_instance(instance)
+
+    def test_load_json_stream(self):
+        class JsonTestIter(JsonNetIter):
+            url = "http://example.com/test.json"
+
+        instance = JsonTestIter(stream=True)
+        self.check_instance(instance)
+
+    def test_http_cache(self):
+        requests_seen = []
+
+        def respond(request, uri, headers):
+            requests_seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return (304, {"ETag": '"v1"'}, "")
+            return (200, {"ETag": '"v1"'}, "one,two,three\n1,2,3\n4,5,6")
+
+        httpretty.register_uri(
+            httpretty.GET, "http://example.com/cached.csv", body=respond
+        )
+
+        class CachedIter(CsvNetIter):
+            url = "http://example.com/cached.csv"
+            http_cache = tempfile.mkdtemp()
+
+        try:
+            self.check_instance(CachedIter())
+            self.check_instance(CachedIter())
+            self.check_instance(CachedIter(stream=True))
+            self.assertEqual(requests_seen, [None, '"v1"', '"v1"'])
+
+            # Fresh responses are served without revalidation
+            self.check_instance(CachedIter(http_cache_ttl=60))
+            self.assertEqual(len(requests_seen), 3)
+
+            # Different parameters are cached separately
+            self.check_instance(CachedIter(params={"test": 1}))
+            self.assertEqual(requests_seen[-1], None)
+            self.assertEqual(len(os.listdir(CachedIter.http_cache)), 4)
+
+            # Least recently used responses are evicted when over max_size
+            self.check_instance(CachedIter(params="2", http_cache_max_size=30))
+            self.assertEqual(len(os.listdir(CachedIter.http_cache)), 2)
+        finally:
+            shutil.rmtree(CachedIter.http_cache)
+
+    def test_shared_session(self):
+        instance = TestIter()
+        client = instance.get_client()
+        self.assertIsInstance(client, requests.Session)
+        self.assertIs(TestIter().get_client(), client)
+        self.assertIsNot(TestIter(pool_maxsize=1).get_client(), client)
+
+    def test_shared_session_cookies(self):
+        def respond(request, uri, headers):
+            cookies.append(request.headers.get("Cookie"))
+            user = request.querystring["user"][0]
+            headers["Set-Cookie"] = "session=%s; Path=/" % user
+            return (200, headers, "one,two,three\n1,2,3\n4,5,6")
+
+        cookies = []
+        httpretty.register_uri(
+            httpretty.GET, "http://example.com/cookie.csv", body=respond
+        )
+
+        class CookieIter(CsvNetIter):
+            url = "http://example.com/cookie.csv"
+
+        self.check_instance(CookieIter(params={"user": "alice"}))
+        self.check_instance(CookieIter(params={"user": "bob"}))
+        self.assertEqual(cookies, [None, None])
+
+    def test_custom_client(self):
+        session = requests.Session()
+
+        class SessionTestIter(TestIter):
+            client = session
+
+        self.assertIs(SessionTestIter().get_client(), session)
+        self.check_instance(SessionTestIter())
+        self.check_instance(TestIter(client=requests))
+
     def test_load_fail(self):
         class TestIter(CsvNetIter):
             url = "http://example.com/fail.txt"
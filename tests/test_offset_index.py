@@ -0,0 +1,103 @@
+from itertable import CsvFileIter
+from itertable.exceptions import ReadOnly
+from .base import IterTestCase
+import pickle
+import os
+
+
+class KeyCsvFileIter(CsvFileIter):
+    key_field = "one"
+
+
+class OffsetIndexTestCase(IterTestCase):
+    def setUp(self):
+        rows = ['%s,"value\n%s",%s' % (i, i, i * 2) for i in range(100)]
+        rows.insert(50, "")
+        self.filename = self.write_csv(
+            "Title\n\none,two,three\n" + "\r\n".join(rows)
+        )
+
+    def write_csv(self, content):
+        return self.write_temp_file("test.csv", content)
+
+    def test_offset_index(self):
+        serial = CsvFileIter(filename=self.filename)
+        instance = CsvFileIter(filename=self.filename, offset_index=True)
+        self.assertEqual(len(instance), 100)
+        self.assertEqual(instance[0], serial[0])
+        self.assertEqual(instance[-1], serial[-1])
+        self.assertEqual(instance[50].two, "value\n50")
+        self.assertEqual(list(instance.data), serial.data)
+        self.assertEqual(instance.data[98:], serial.data[98:])
+        self.assertFalse(os.path.exists(self.filename + ".idx"))
+
+    def test_offset_index_read_only(self):
+        instance = CsvFileIter(filename=self.filename, offset_index=True)
+        with self.assertRaises(ReadOnly):
+            instance.append({"one": 1, "two": 2, "three": 3})
+        with self.assertRaises(ReadOnly):
+            instance.insert(0, {"one": 1, "two": 2, "three": 3})
+        with self.assertRaises(ReadOnly):
+            instance[0] = {"one": 1, "two": 2, "three": 3}
+        with self.assertRaises(ReadOnly):
+            del instance[0]
+        with self.assertRaises(ReadOnly):
+            instance.save()
+        self.assertEqual(len(instance), 100)
+
+    def test_offset_index_files(self):
+        for name in "test", "test2":
+            instance = CsvFileIter(
+                filename=self.get_filename(name, "csv"), offset_index=True
+            )
+            self.check_instance(instance)
+
+    def test_offset_index_key(self):
+        instance = KeyCsvFileIter(filename=self.filename, offset_index=True)
+        self.assertEqual(instance["42"].three, "84")
+        self.assertEqual(instance.compute_index()["42"], 42)
+
+    def test_persist_offset_index(self):
+        index_filename = self.filename + ".idx"
+        instance = CsvFileIter(
+            filename=self.filename,
+            offset_index=True,
+            persist_offset_index=True,
+        )
+        self.assertEqual(instance[10].one, "10")
+        self.assertTrue(os.path.exists(index_filename))
+        stat = os.stat(self.filename)
+        offsets = instance.load_offset_index(stat)
+        self.assertEqual(len(offsets), 100)
+
+        # Saved index is reused
+        instance.save_offset_index(stat, offsets[10:])
+        instance = CsvFileIter(
+            filename=self.filename,
+            offset_index=True,
+            persist_offset_index=True,
+        )
+        self.assertEqual(instance[0].one, "10")
+
+        # Index is rebuilt after the file changes
+        self.write_csv("one,two,three\n1,2,3\n4,5,6\n")
+        instance = CsvFileIter(
+            filename=self.filename,
+            offset_index=True,
+            persist_offset_index=True,
+        )
+        self.check_instance(instance)
+
+    def test_invalid_offset_index(self):
+        # Corrupt (or unexpected) index files are ignored and replaced
+        index_filename = self.filename + ".idx"
+        for content in b"", b"ITIDX001", b"garbage" * 10, pickle.dumps([1]):
+            with open(index_filename, "wb") as f:
+                f.write(content)
+            instance = CsvFileIter(
+                filename=self.filename,
+                offset_index=True,
+                persist_offset_index=True,
+            )
+            self.assertEqual(len(instance), 100)
+            self.assertEqual(instance[99].one, "99")
@@ -0,0 +1,61 @@
+from itertable import CsvFileIter
+from itertable.parsers.readers import split_records
+from .base import IterTestCase
+import io
+
+
+class ParallelTestCase(IterTestCase):
+    def test_split_records(self):
+        data = b'a,b\n1,"x\ny\nz"\n2,3\n4,"5"\n'
+        chunks = split_records(io.BytesIO(data), 0, len(data), 4)
+        self.assertEqual(chunks[0][0], 0)
+        self.assertEqual(chunks[-1][1], len(data))
+        for (start, end), (next_start, next_end) in zip(chunks, chunks[1:]):
+            self.assertEqual(end, next_start)
+        self.assertEqual(
+            [data[start:end] for start, end in chunks],
+            [b'a,b\n1,"x\ny\nz"\n', b'2,3\n4,"5"\n'],
+        )
+
+    def test_parallel_parse(self):
+        rows = ['%s,"value\n%s",%s' % (i, i, i * 2) for i in range(500)]
+        filename = self.write_temp_file(
+            "test.csv",
+            "Title\nPrelude\none,two,three\n" + "\r\n".join(rows) + "\n",
+        )
+        serial = CsvFileIter(filename=filename)
+        parallel = CsvFileIter(
+            filename=filename, parse_processes=3, parallel_min_size=0
+        )
+        self.assertEqual(parallel.field_names, ["one", "two", "three"])
+        self.assertEqual(len(parallel), 500)
+        self.assertEqual(parallel.data, serial.data)
+        self.assertEqual(parallel[499].two, "value\n499")
+
+    def test_parallel_parse_files(self):
+        for name in "test", "test2":
+            instance = CsvFileIter(
+                filename=self.get_filename(name, "csv"),
+                parse_processes=2,
+                parallel_min_size=0,
+            )
+            self.check_instance(instance)
+
+    def test_parallel_parse_memory_map(self):
+        instance = CsvFileIter(
+            filename=self.get_filename("test2", "csv"),
+            memory_map=True,
+            parse_processes=2,
+            parallel_min_size=0,
+        )
+        self.check_instance(instance)
+
+    def test_parallel_parse_field_names(self):
+        filename = self.write_temp_file("test.csv", "1,2,3\n4,5,6\n")
+        instance = CsvFileIter(
+            filename=filename,
+            field_names=["one", "two", "three"],
+            parse_processes=2,
+            parallel_min_size=0,
+        )
+        self.check_instance(instance)
@@ -0,0 +1,105 @@
+from itertable import CsvFileIter, ExcelFileIter, CsvStringIter
+from .base import IterTestCase
+import shutil
+import os
+
+
+class CountMixin:
+    parse_count = 0
+
+    def parse(self):
+        type(self).parse_count += 1
+        super().parse()
+
+
+class CountCsvFileIter(CountMixin, CsvFileIter):
+    pass
+
+
+class CountExcelFileIter(CountMixin, ExcelFileIter):
+    pass
+
+
+class CountCsvStringIter(CountMixin, CsvStringIter):
+    pass
+
+
+class ParseCacheTestCase(IterTestCase):
+    def setUp(self):
+        self.cache_dir = self.get_temp_filename("cache")
+        for cls in CountCsvFileIter, CountExcelFileIter, CountCsvStringIter:
+            cls.parse_count = 0
+
+    def load(self, cls, **kwargs):
+        instance = cls(parse_cache=self.cache_dir, **kwargs)
+        self.check_instance(instance)
+        return instance
+
+    def test_parse_cache_file(self):
+        filename = self.get_temp_filename("test.csv")
+        shutil.copy(self.get_filename("test2", "csv"), filename)
+        cls = CountCsvFileIter
+        self.load(cls, filename=filename)
+        instance = self.load(cls, filename=filename)
+        self.assertEqual(cls.parse_count, 1)
+        self.assertEqual(instance.field_names, ["one", "two", "three"])
+        self.assertEqual(instance.header_row, 3)
+        self.assertTrue(instance.file.closed)
+
+        # Different options
+        self.load(cls, filename=filename, max_header_row=10)
+        self.assertEqual(cls.parse_count, 2)
+
+        # Modified file
+        with open(filename, "a") as f:
+            f.write("\n")
+        os.utime(filename, ns=(0, 0))
+        self.load(cls, filename=filename)
+        self.assertEqual(cls.parse_count, 3)
+
+    def test_parse_cache_excel(self):
+        filename = self.get_filename("test", "xlsx")
+        cls = CountExcelFileIter
+        self.load(cls, filename=filename)
+        instance = self.load(cls, filename=filename)
+        self.assertEqual(cls.parse_count, 1)
+        self.assertIsNone(instance.workbook)
+
+    def test_parse_cache_string(self):
+        cls = CountCsvStringIter
+        self.load(cls, string="one,two,three\n1,2,3\n4,5,6")
+        self.load(cls, string="one,two,three\n1,2,3\n4,5,6")
+        self.assertEqual(cls.parse_count, 1)
+        self.load(cls, string="one,two,three\n1,2,3\n4,5,6\n")
+        self.assertEqual(cls.parse_count, 2)
+
+    def test_parse_cache_max_size(self):
+        cls = CountCsvStringIter
+        string = "one,two,three\n1,2,3\n4,5,6"
+        self.load(cls, string=string, parse_cache_max_size=1)
+        self.load(cls, string=string + "\n", parse_cache_max_size=1)
+        names = [n for n in os.listdir(self.cache_dir) if n.endswith("data")]
+        self.assertEqual(len(names), 1)
+
+
+class DiskCacheTestCase(IterTestCase):
+    def test_concurrent_set(self):
+        from itertable.cache import DiskCache
+        from concurrent.futures import ThreadPoolExecutor
+
+        directory = self.get_temp_dir()
+        cache = DiskCache(directory)
+        values = [bytes([i]) * 100000 for i in range(8)]
+
+        def write(value):
+            cache.set("key", [value[:50000], value[50000:]], {})
+
+        for attempt in range(5):
+            with ThreadPoolExecutor(8) as executor:
+                list(executor.map(write, values))
+            with open(cache.get_path("key"), "rb") as f:
+                self.assertIn(f.read(), values)
+            self.assertIsNotNone(cache.get_meta("key"))
+        self.assertEqual(
+            sorted(os.listdir(directory)), ["key.data", "key.json"]
+        )
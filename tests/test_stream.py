@@ -0,0 +1,49 @@
+from itertable import CsvFileIter, CsvStringIter
+from .base import IterTestCase
+import pickle
+
+
+class StreamTestCase(IterTestCase):
+    def test_stream_csv(self):
+        filename = self.get_filename("test", "csv")
+        instance = CsvFileIter(filename=filename, stream=True)
+        self.assertFalse(instance.parsed)
+        self.assertFalse(hasattr(instance, "data"))
+        self.assertFalse(instance.file.closed)
+
+        # (list() would call len() and trigger a full load)
+        rows = [row for row in instance]
+        self.assertTrue(instance.file.closed)
+        self.assertFalse(hasattr(instance, "data"))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1].three, "6")
+
+        # Iterating again reloads the file
+        self.assertEqual([row for row in instance], rows)
+        self.assertFalse(hasattr(instance, "data"))
+
+        # Random access triggers a full load
+        self.check_instance(instance)
+        self.assertTrue(instance.parsed)
+        self.assertEqual(len(instance.data), 2)
+
+    def test_stream_csv_prelude(self):
+        filename = self.get_filename("test2", "csv")
+        instance = CsvFileIter(filename=filename, stream=True)
+        self.assertEqual([r for r in instance], [r for r in instance])
+        self.check_instance(instance)
+
+    def test_stream_csv_field_names(self):
+        instance = CsvStringIter(
+            string="1,2,3\n4,5,6",
+            field_names=["one", "two", "three"],
+            stream=True,
+        )
+        self.assertEqual([r for r in instance], [r for r in instance])
+        self.check_instance(instance)
+
+    def test_stream_pickle(self):
+        filename = self.get_filename("test", "csv")
+        instance = CsvFileIter(filename=filename, stream=True)
+        instance = pickle.loads(pickle.dumps(instance))
+        self.check_instance(instance)
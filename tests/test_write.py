@@ -1,5 +1,8 @@
 from itertable import load_file
 from itertable import (
+    CsvStringIter,
+    JsonStringIter,
+    XmlStringIter,
     CsvFileIter,
     JsonFileIter,
     XmlFileIter,
@@ -7,6 +10,8 @@ from itertable import (
     ExcelFileIter,
 )
 from .base import IterTestCase
+from io import StringIO
+import json
 
 
 class LoadFileTestCase(IterTestCase):
@@ -103,3 +108,55 @@ class LoadFileTestCase(IterTestCase):
 
         new_class.__name__ = "Dict" + cls.__name__
         return new_class
+
+    def test_dump_stream(self):
+        """
+        Test BaseIter.dump() from a streaming source Iter
+        """
+        for ext, cls in zip(self.types, self.classes):
+            source = CsvFileIter(
+                filename=self.get_filename("test", "csv"), stream=True
+            )
+            filename = self.get_temp_filename("stream.%s" % ext)
+            instance = cls(
+                filename=filename,
+                require_existing=False,
+                root_tag="root",
+                item_tag="item",
+            )
+            with open(filename, "wb" if cls.binary else "w") as f:
+                instance.dump(f, data=source)
+            self.assertFalse(hasattr(source, "data"))
+            self.check_instance(load_file(filename))
+
+    def test_dump_iterator(self):
+        def dump(cls, data, **kwargs):
+            instance = cls(lazy=True, **kwargs)
+            output = StringIO()
+            instance.dump(output, data=data)
+            return output.getvalue()
+
+        output = dump(JsonStringIter, iter(self.data))
+        self.assertEqual(json.loads(output), self.data)
+
+        output = dump(JsonStringIter, iter([]), namespace="items")
+        self.assertEqual(json.loads(output), {"items": []})
+
+        output = dump(
+            XmlStringIter,
+            (row for row in self.data),
+            root_tag="root",
+            item_tag="item",
+        )
+        self.assertEqual(
+            output,
+            "<root><item><one>1</one><two>2</two><three>3</three></item>"
+            "<item><one>4</one><two>5</two><three>6</three></item></root>",
+        )
+        output = dump(XmlStringIter, [], root_tag="root", item_tag="item")
+        self.assertEqual(output, "<root />")
+
+        output = dump(CsvStringIter, iter(self.data))
+        self.assertEqual(
+            output.splitlines(), ["one,two,three", "1,2,3", "4,5,6"]
+        )
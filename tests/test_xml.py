@@ -0,0 +1,43 @@
+from itertable import XmlFileIter, XmlStringIter
+from .base import IterTestCase
+
+
+class XmlTestCase(IterTestCase):
+    def test_stream(self):
+        filename = self.get_filename("test", "xml")
+        instance = XmlFileIter(filename=filename, stream=True)
+        rows = [row for row in instance]
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1].three, "6")
+        self.assertEqual(instance.root_tag, "root")
+        self.assertEqual(instance.item_tag, "item")
+        self.assertFalse(hasattr(instance, "data"))
+        self.assertTrue(instance.file.closed)
+        self.check_instance(instance)
+
+    def test_stream_root_tag(self):
+        filename = self.get_filename("custom", "xml")
+        instance = XmlFileIter(
+            filename=filename, root_tag="items", item_tag="item", stream=True
+        )
+        self.assertEqual([row.one for row in instance], ["1", "4"])
+        self.check_instance(instance)
+
+    def test_stream_clear(self):
+        class ItemsIter(XmlStringIter):
+            def parse_item(self, el):
+                self.parsed_items.append(el)
+                return super().parse_item(el)
+
+        instance = ItemsIter(
+            string="<root><skip><item><one>0</one></item></skip>"
+            "<item><one>1</one></item><other/><item><one>2</one></item>"
+            "</root>",
+            item_tag="item",
+            stream=True,
+            parsed_items=[],
+        )
+        self.assertEqual([row.one for row in instance], ["1", "2"])
+        # Elements are cleared after they are parsed
+        self.assertEqual(len(instance.parsed_items), 2)
+        self.assertEqual(len(instance.parsed_items[0]), 0)
@@ -1,4 +1,5 @@
 from itertable import (
+    flattened,
     ZipFileLoader,
     ZipNetLoader,
     CsvParser,
@@ -8,6 +9,7 @@ from itertable import (
 )
 from .base import IterTestCase
 from itertable.exceptions import LoadFailed
+from zipfile import ZipFile
 import httpretty
 
 
@@ -15,6 +17,10 @@ class CsvZipFileIter(ZipFileLoader, CsvParser, TupleMapper, BaseIter):
     inner_binary = False
 
 
+class NestedCsvZipFileIter(CsvZipFileIter):
+    nested = True
+
+
 class ExcelZipFileIter(ZipFileLoader, ExcelParser, TupleMapper, BaseIter):
     inner_binary = True
 
@@ -24,6 +30,11 @@ class CsvZipNetIter(ZipNetLoader, CsvParser, TupleMapper, BaseIter):
     inner_binary = False
 
 
+class NestedCsvZipNetIter(CsvZipNetIter):
+    url = "http://example.com/testnested.zip"
+    nested = True
+
+
 class ExcelZipNetIter(ZipNetLoader, ExcelParser, TupleMapper, BaseIter):
     url = "http://example.com/testxlsx.zip"
     inner_binary = True
@@ -35,10 +46,22 @@ class ZipFileTestCase(IterTestCase):
         instance = CsvZipFileIter(filename=filename)
         self.check_instance(instance)
 
+    def test_csv_zip_stream(self):
+        filename = self.get_filename("testcsv", "zip")
+        instance = CsvZipFileIter(filename=filename, stream=True)
+        self.assertIsNotNone(instance.archive)
+        rows = [row for row in instance]
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1].three, "6")
+        self.assertTrue(instance.file.closed)
+        self.assertIsNone(instance.archive)
+        self.check_instance(instance)
+
     def test_xlsx_zip(self):
         filename = self.get_filename("testxlsx", "zip")
         instance = ExcelZipFileIter(filename=filename)
         self.check_instance(instance)
+        self.assertIsNone(instance.archive)
 
     def test_multi_zip(self):
         filename = self.get_filename("testmulti", "zip")
@@ -52,14 +75,93 @@ class ZipFileTestCase(IterTestCase):
         self.check_instance(instance)
 
 
+def make_nested_zip(test):
+    filename = test.get_temp_filename("testnested.zip")
+    with ZipFile(filename, "w") as archive:
+        archive.write(test.get_filename("test", "csv"), "test.csv")
+        archive.writestr("sub/", "")
+        archive.write(test.get_filename("test2", "csv"), "sub/test2.csv")
+    return filename
+
+
+class NestedZipFileTestCase(IterTestCase):
+    def setUp(self):
+        self.filename = make_nested_zip(self)
+
+    def check_nested(self, instance):
+        self.assertEqual(len(instance), 2)
+        self.assertEqual(instance[0].name, "test.csv")
+        self.assertEqual(instance[1].name, "sub/test2.csv")
+        for row in instance:
+            self.check_instance(row.data)
+
+    def test_nested_zip(self):
+        instance = NestedCsvZipFileIter(filename=self.filename)
+        self.assertIsNone(instance.archive)
+        inner = instance[0].data
+        self.assertFalse(inner.loaded)
+        self.assertFalse(inner.parsed)
+        self.check_nested(instance)
+        self.assertTrue(inner.parsed)
+
+    def test_nested_multi_zip(self):
+        filename = self.get_filename("testmulti", "zip")
+        instance = NestedCsvZipFileIter(filename=filename)
+        self.assertEqual([row.name for row in instance], ["test.csv"])
+        self.check_instance(instance[0].data)
+
+    def test_nested_zip_options(self):
+        filename = self.get_temp_filename("semicolon.zip")
+        with ZipFile(filename, "w") as archive:
+            archive.writestr("a.csv", "x;y\n1;2\n")
+            archive.writestr("b.csv", "x;y\n3;4\n")
+
+        instance = NestedCsvZipFileIter(
+            filename=filename, delimiter=";", max_workers=2
+        )
+        self.assertEqual(
+            [(row.name, row.data[0]) for row in instance],
+            [("a.csv", ("1", "2")), ("b.csv", ("3", "4"))],
+        )
+        self.assertEqual(instance[0].data.field_names, ["x", "y"])
+        self.assertIsNone(instance[0].data.max_workers)
+
+    def test_nested_zip_workers(self):
+        instance = NestedCsvZipFileIter(filename=self.filename, max_workers=2)
+        self.assertTrue(all(row.data.parsed for row in instance))
+        self.check_nested(instance)
+
+    def test_nested_zip_stream(self):
+        instance = NestedCsvZipFileIter(filename=self.filename, stream=True)
+        self.assertEqual(
+            [row.name for row in instance], ["test.csv", "sub/test2.csv"]
+        )
+        self.check_nested(instance)
+
+    def test_nested_zip_flattened(self):
+        instance = flattened(NestedCsvZipFileIter, filename=self.filename)
+        self.assertEqual(len(instance), 4)
+        self.assertEqual(
+            [(row.name, row.one) for row in instance],
+            [
+                ("test.csv", "1"),
+                ("test.csv", "4"),
+                ("sub/test2.csv", "1"),
+                ("sub/test2.csv", "4"),
+            ],
+        )
+
+
 class NetZipFileTestCase(IterTestCase):
     def setUp(self):
         httpretty.enable()
         self.register_url("testcsv")
         self.register_url("testxlsx")
+        self.register_url("testnested", make_nested_zip(self))
 
-    def register_url(self, name):
-        filename = self.get_filename(name, "zip")
+    def register_url(self, name, filename=None):
+        if filename is None:
+            filename = self.get_filename(name, "zip")
         zipfile = open(filename, "rb")
         zipdata = zipfile.read()
         zipfile.close()
@@ -79,3 +181,10 @@ class NetZipFileTestCase(IterTestCase):
 
     def test_xlsx_zip(self):
         self.check_instance(ExcelZipNetIter())
+
+    def test_nested_zip(self):
+        instance = NestedCsvZipNetIter()
+        self.assertEqual(len(instance), 2)
+        for row in instance:
+            self.check_instance(row.data)
+        self.assertEqual(len(httpretty.latest_requests()), 1)